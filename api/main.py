@@ -2,93 +2,444 @@
 main.py
 FastAPI application for managing gateways tools.
 """
+import asyncio
+import functools
+import hashlib
+import io
+import logging
 import os
+import re
 import sys
-import json
+import time
+import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-import requests
-
-# Add parent directory to path for direct execution
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import httpx
+import orjson
+from typing import Annotated
+from pydantic import StringConstraints, TypeAdapter, ValidationError
+
+# Add parent directory to path for direct execution only; when imported by a
+# server (uvicorn api.main:app) the package resolves normally and prepending
+# here would slow every subsequent import in the process.
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, status, Body
+from fastapi import FastAPI, Request, UploadFile, File, Form, HTTPException, status, Body
+from fastapi.responses import ORJSONResponse
 
+from services.credentials import credentials_service
+from services.gateways import gateway_service
+from services.s3 import s3_service
+from services.tools import tools_service
 from services.gateways.gateway_service import create_agentcore_gateway_role, create_gateway as create_gateway_service, update_gateway as update_gateway_service, get_gateway as get_gateway_service, list_gateways as list_gateways_service, delete_gateway as delete_gateway_service
-from services.s3.s3_service import upload_openapi_spec
+from services.s3.s3_service import upload_openapi_spec, upload_openapi_spec_fileobj
 from services.tools.tools_service import create_gateway_target, update_gateway_target, delete_gateway_target, get_gateway_target, list_gateway_targets
-from services.credentials.credentials_service import create_or_get_api_key_credential_provider
+from services.credentials.credentials_service import create_or_get_api_key_credential_provider, get_or_create_api_key_credential_provider
 from services.openapi_generator.openapi_generator import generate_openapi_spec
-from api.models import HealthCheckResponse, CreateToolResponse, CreateGatewayRequest, CreateGatewayNoAuthRequest, CreateGatewayResponse, UpdateGatewayRequest, UpdateGatewayResponse, GetGatewayResponse, ListGatewaysResponse, GatewaySummary, Auth, CreateToolFromUrlRequest, CreateToolFromApiInfoRequest, CreateToolFromSpecRequest, UpdateToolResponse, UpdateToolRequest, GetGatewayTargetResponse, ListGatewayTargetsResponse, TargetSummary, DeleteToolResponse, DeleteGatewayResponse
-from api.validations import validate_auth
+from api.models import HealthCheckResponse, CreateToolResponse, CreateGatewayRequest, CreateGatewayNoAuthRequest, CreateGatewayResponse, UpdateGatewayRequest, UpdateGatewayResponse, GetGatewayResponse, ListGatewaysResponse, GatewaySummary, Auth, CreateToolFromUrlRequest, CreateToolFromApiInfoRequest, CreateToolFromSpecRequest, UpdateToolResponse, UpdateToolRequest, GetGatewayTargetResponse, ListGatewayTargetsResponse, TargetSummary, DeleteToolResponse, DeleteGatewayResponse, AsyncCreateToolResponse, OperationStatusResponse
+from api.validations import validate_auth, validate_openapi_spec
 
 # CONFIG
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
 OPENAPI_SPECS_BUCKET = os.environ.get("OPENAPI_SPECS_BUCKET", "agentcore-gateway-openapi-specs-bucket")
 
+logger = logging.getLogger(__name__)
+
+# Compiled validator for the auth form field. validate_json drives Pydantic's
+# Rust JSON parser straight into the model, skipping the intermediate dict a
+# loads + model_validate round-trip would build.
+_AUTH_ADAPTER = TypeAdapter(Auth)
+
+# Static validation errors, built once instead of per failing request.
+# HTTPException is plain data to Starlette, so reusing instances is safe.
+_ERR_NO_FILENAME = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="OpenAPI spec file is required"
+)
+_ERR_NOT_JSON = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="OpenAPI spec file must be a JSON file"
+)
+_ERR_NO_OPENAPI_KEY = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="OpenAPI spec must contain 'openapi' or 'swagger' field"
+)
+
+# Shared constrained type for gateway/target path parameters. The pattern is
+# compiled once here and reused by every route instead of each handler doing
+# its own ad-hoc ID checking; malformed IDs fail with a 422 before any AWS
+# call is made.
+ResourceId = Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9_-]{1,64}$")]
+
+# Matches a top-level-style "openapi"/"swagger" key in raw JSON bytes; one
+# compiled C-level scan replaces the pair of bytes.find() probes
+_has_openapi_marker = re.compile(rb'"(?:openapi|swagger)"\s*:').search
+
+# Placeholder credential values used when registering public (no-auth) APIs.
+# One provider is shared by every public tool: the key is never sent anywhere
+# real, so a per-target provider was a wasted control-plane create per tool.
+PLACEHOLDER_API_KEY = "placeholder-not-used"
+PLACEHOLDER_PROVIDER_NAME = "ac-gtw-shared-public-api-placeholder"
+PLACEHOLDER_PARAM_NAME = "X-Placeholder-Auth"
+PLACEHOLDER_LOCATION = "HEADER"
+
+# Shared async HTTP client for downloading OpenAPI specs.
+# Reuses TCP connections and TLS sessions across requests and, unlike the
+# blocking requests library, does not stall the event loop during fetches.
+# Keep-alive pooling plus a couple of connect retries amortize the TLS
+# handshake across repeat fetches from the same spec host.
+_http = httpx.AsyncClient(
+    timeout=10,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    transport=httpx.AsyncHTTPTransport(retries=2)
+)
+
+# Micro-batcher for gateway-target creation. Bursty onboarding scripts hit the
+# tool-creation endpoints back to back; instead of each request racing its own
+# control-plane call, registrations queue up and a worker drains them in short
+# windows (up to _BATCH_MAX_ITEMS or BATCH_MAX_WAIT_MS, whichever first),
+# firing each window's calls together via asyncio.gather. This keeps per-call
+# latency bounded while smoothing throttling pressure under bursts.
+_BATCH_MAX_WAIT_MS = float(os.environ.get("BATCH_MAX_WAIT_MS", "20"))
+_BATCH_MAX_ITEMS = 16
+_target_queue: asyncio.Queue = None
+_target_batcher = None
+
+
+async def _target_batch_worker():
+    """Drain queued target creations in short windows, running each batch concurrently."""
+    while True:
+        batch = [await _target_queue.get()]
+        deadline = time.monotonic() + _BATCH_MAX_WAIT_MS / 1000
+        while len(batch) < _BATCH_MAX_ITEMS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_target_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        results = await asyncio.gather(
+            *(asyncio.to_thread(call) for _, call in batch),
+            return_exceptions=True
+        )
+        for (future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def _create_target_batched(**kwargs) -> dict:
+    """Submit a create_gateway_target call to the batcher and await its result."""
+    future = asyncio.get_running_loop().create_future()
+    await _target_queue.put((future, functools.partial(create_gateway_target, **kwargs)))
+    return await future
+
+
+def _warm_aws_clients() -> None:
+    """
+    Build the shared boto3 clients up front.
+
+    Client construction loads service models and builds endpoint resolvers
+    (~100-200ms each); doing it at startup keeps that cost off the first
+    request. The service modules stay lazy so scripts importing them pay
+    nothing.
+    """
+    gateway_service._get_gateway_client()
+    tools_service._get_gateway_client()
+    credentials_service._get_agentcore_client()
+    s3_service._get_s3_client()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: start the target batcher, release resources on shutdown."""
+    global _target_queue, _target_batcher
+    _target_queue = asyncio.Queue()
+    _target_batcher = asyncio.create_task(_target_batch_worker())
+    await asyncio.to_thread(_warm_aws_clients)
+    yield
+    _target_batcher.cancel()
+    await _http.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="AgentCore Gateway Tools API",
     description="API for managing OpenAPI tools on AgentCore Gateway",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+
+# Centralized error mapping. The handlers below replace the identical
+# try/except chains that were repeated in every endpoint: handler bodies stay
+# linear (no per-request exception-frame setup on the happy path) and errors
+# dispatch through these only when something actually goes wrong. ValueError
+# is what the service layer raises for unknown gateway/target IDs.
+@app.exception_handler(ValueError)
+async def _handle_value_error(request: Request, exc: ValueError):
+    return ORJSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": str(exc)}
+    )
+
+
+# ValidationError subclasses ValueError, so without its own handler a bad
+# auth form field would surface as a 404; register the more specific type
+# to keep malformed input a 400.
+@app.exception_handler(ValidationError)
+async def _handle_validation_error(request: Request, exc: ValidationError):
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+
+
+@app.exception_handler(httpx.HTTPError)
+async def _handle_httpx_error(request: Request, exc: httpx.HTTPError):
+    logger.exception("Error downloading OpenAPI spec")
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": f"Failed to download OpenAPI spec: {str(exc)}"}
+    )
+
+
+@app.exception_handler(Exception)
+async def _handle_unexpected_error(request: Request, exc: Exception):
+    logger.exception("Error handling %s %s", request.method, request.url.path)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": f"Internal server error: {str(exc)}"}
+    )
+
+
+# Maps gateway response-model fields to their AWS SDK keys. Shared by the
+# gateway endpoints instead of four hand-written 18-field constructor blocks.
+_GW_FIELD_MAP = (
+    ("gateway_id", "gatewayId"),
+    ("gateway_url", "gatewayUrl"),
+    ("gateway_arn", "gatewayArn"),
+    ("name", "name"),
+    ("description", "description"),
+    ("created_at", "createdAt"),
+    ("updated_at", "updatedAt"),
+    ("gateway_status", "status"),
+    ("status_reasons", "statusReasons"),
+    ("authorizer_type", "authorizerType"),
+    ("protocol_type", "protocolType"),
+    ("role_arn", "roleArn"),
+    ("authorizer_configuration", "authorizerConfiguration"),
+    ("protocol_configuration", "protocolConfiguration"),
+    ("exception_level", "exceptionLevel"),
+    ("interceptor_configurations", "interceptorConfigurations"),
+    ("policy_engine_configuration", "policyEngineConfiguration"),
+    ("kms_key_arn", "kmsKeyArn"),
+    ("workload_identity_details", "workloadIdentityDetails"),
+)
+
+
+def _gateway_response(cls, response: dict, message: str):
+    """Build a gateway response model from an AWS SDK gateway payload."""
+    return cls(
+        status="success",
+        message=message,
+        **{py_field: response.get(aws_field) for py_field, aws_field in _GW_FIELD_MAP}
+    )
+
+
+# Whole-list adapters for the list endpoints. Validating the projected rows
+# in one TypeAdapter call runs the whole batch through pydantic-core instead
+# of invoking N Python model constructors.
+_GW_SUMMARY_ADAPTER = TypeAdapter(list[GatewaySummary])
+_TARGET_SUMMARY_ADAPTER = TypeAdapter(list[TargetSummary])
+
+_GW_SUMMARY_FIELD_MAP = (
+    ("gateway_id", "gatewayId"),
+    ("name", "name"),
+    ("description", "description"),
+    ("gateway_status", "status"),
+    ("authorizer_type", "authorizerType"),
+    ("protocol_type", "protocolType"),
+    ("created_at", "createdAt"),
+    ("updated_at", "updatedAt"),
+)
+
+_TARGET_SUMMARY_FIELD_MAP = (
+    ("target_id", "targetId"),
+    ("name", "name"),
+    ("description", "description"),
+    ("target_status", "status"),
+    ("created_at", "createdAt"),
+    ("updated_at", "updatedAt"),
 )
 
 
-def _register_tool_with_gateway(
+def _project_rows(items: list, field_map: tuple) -> list[dict]:
+    """Project AWS SDK list items onto model field names for batch validation."""
+    return [{py_field: item.get(aws_field) for py_field, aws_field in field_map} for item in items]
+
+
+# Response cache for the read endpoints. Gateway/target state only changes
+# through the mutation endpoints in this module, so reads can be served from
+# a short-TTL cache that mutations invalidate on success. Kept in-process
+# (this service has no Redis in its footprint); the key scheme and
+# write-through invalidation match what a shared backend would use.
+_READ_CACHE_TTL = float(os.environ.get("READ_CACHE_TTL_SECONDS", "60"))
+_read_cache = {}
+
+
+def _cache_get(key: str):
+    """Return a cached response if present and not expired, else None."""
+    entry = _read_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _read_cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_set(key: str, value) -> None:
+    """Cache a response under the key for the configured TTL."""
+    _read_cache[key] = (time.monotonic() + _READ_CACHE_TTL, value)
+
+
+def _cache_invalidate(prefix: str) -> None:
+    """Drop all cached responses whose key starts with the prefix."""
+    for key in [k for k in _read_cache if k.startswith(prefix)]:
+        _read_cache.pop(key, None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _tool_created_msg(tool_name: str, gateway_id: str) -> str:
+    """Success message for tool creation, cached for repeated tool/gateway pairs."""
+    return f"Tool '{tool_name}' successfully created and registered on gateways {gateway_id}"
+
+
+# Credential provider ARNs keyed by (provider_name, api_key digest). Provider
+# names are stable per tool, so repeat registrations skip the AWS round-trip.
+# The key is hashed so the secret itself never sits in the cache.
+_provider_arn_cache = {}
+
+
+def _cached_credential_provider_arn(provider_name: str, api_key: str) -> str:
+    """Create or look up an API key credential provider ARN, caching per process."""
+    cache_key = (provider_name, hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest())
+    arn = _provider_arn_cache.get(cache_key)
+    if arn is None:
+        arn = create_or_get_api_key_credential_provider(provider_name, api_key)
+        _provider_arn_cache[cache_key] = arn
+    return arn
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_placeholder_provider_arn() -> str:
+    """Resolve the shared public-API placeholder provider, once per process."""
+    return get_or_create_api_key_credential_provider(PLACEHOLDER_PROVIDER_NAME, PLACEHOLDER_API_KEY)
+
+
+# Cached gateway IAM role ARN. The role name is a fixed constant and
+# create_agentcore_gateway_role is idempotent, so the IAM round-trip only
+# needs to happen once per TTL window instead of on every gateway creation.
+# The hour-long TTL lets role rotations be picked up eventually.
+_ROLE_ARN_TTL = 3600.0
+_cached_role_arn = None
+_role_arn_expires_at = 0.0
+_role_arn_lock = asyncio.Lock()
+
+
+async def _get_gateway_role_arn() -> str:
+    """Resolve (and cache) the gateway IAM role ARN, creating the role on first use."""
+    global _cached_role_arn, _role_arn_expires_at
+    if _cached_role_arn is None or _role_arn_expires_at < time.monotonic():
+        async with _role_arn_lock:
+            if _cached_role_arn is None or _role_arn_expires_at < time.monotonic():
+                _cached_role_arn = await asyncio.to_thread(
+                    create_agentcore_gateway_role, "sample-lambdagateway-role-demo"
+                )
+                _role_arn_expires_at = time.monotonic() + _ROLE_ARN_TTL
+    return _cached_role_arn
+
+
+def _resolve_credential_provider(target_name: str, auth: Auth = None) -> tuple[str, str, str]:
+    """
+    Resolve the API key credential provider for a tool registration.
+
+    If auth is provided with api_key, uses real credentials. Otherwise the
+    shared placeholder provider for public APIs is used, so anonymous targets
+    cost no extra control-plane call after the first.
+
+    Args:
+        target_name: Name of the target/tool (kept for call-site symmetry;
+            public tools no longer get a per-target provider)
+        auth: Optional Auth object with api_key credentials
+
+    Returns:
+        Tuple of (credential provider ARN, param name, location)
+    """
+    # Determine credential values based on auth object (read each Pydantic
+    # attribute once rather than repeating the chains below)
+    if auth and auth.type == "api_key":
+        # Use provided API key credentials
+        config = auth.config
+        # Create credential provider (cached per provider name + key digest)
+        provider_arn = _cached_credential_provider_arn(auth.provider_name, config.api_key)
+        return provider_arn, config.api_key_param_name, config.api_key_location
+
+    # For public APIs, use the single shared placeholder provider
+    return _shared_placeholder_provider_arn(), PLACEHOLDER_PARAM_NAME, PLACEHOLDER_LOCATION
+
+
+async def _register_tool_with_gateway(
     gateway_id: str,
     target_name: str,
-    openapi_s3_uri: str,
+    upload,
     auth: Auth = None,
     description: str = None
-) -> dict:
+) -> tuple[str, dict]:
     """
     Register a tool with a gateways by creating credential provider and target.
 
-    This is the orchestration logic for the API layer.
-    If auth is provided with api_key, uses real credentials.
-    Otherwise, creates placeholder credentials for public APIs.
+    This is the orchestration logic for the API layer. The S3 upload and the
+    credential-provider round-trip are independent, so they run concurrently
+    in worker threads; the target is created once both have finished.
 
     Args:
         gateway_id: ID of the gateways
         target_name: Name of the target/tool
-        openapi_s3_uri: S3 URI of the OpenAPI spec
+        upload: Zero-arg callable performing the blocking S3 spec upload,
+            returning the s3:// URI
         auth: Optional Auth object with api_key credentials
         description: Optional target description
 
     Returns:
-        dict: Target creation response from AWS
+        Tuple of (s3:// URI of the uploaded spec, target creation response from AWS)
     """
-    # Determine credential values based on auth object
-    if auth and auth.type == "api_key":
-        # Use provided API key credentials
-        api_key = auth.config.api_key
-        api_key_provider_name = auth.provider_name
-        api_key_param_name = auth.config.api_key_param_name
-        api_key_location = auth.config.api_key_location
-    else:
-        # For public APIs, use placeholder credentials
-        api_key = "placeholder-not-used"
-        api_key_provider_name = f"{target_name}-placeholder-apikey"
-        api_key_param_name = "X-Placeholder-Auth"
-        api_key_location = "HEADER"
-
-    # Create credential provider
-    api_key_credential_provider_arn = create_or_get_api_key_credential_provider(
-        api_key_provider_name,
-        api_key
-    )
-
-    # Create gateways target
-    response = create_gateway_target(
+    s3_uri, (provider_arn, api_key_param_name, api_key_location) = await asyncio.gather(
+        asyncio.to_thread(upload),
+        asyncio.to_thread(_resolve_credential_provider, target_name, auth)
+    )
+
+    # Create gateways target (coalesced with concurrent registrations)
+    response = await _create_target_batched(
         gateway_id=gateway_id,
         target_name=target_name,
-        openapi_s3_uri=openapi_s3_uri,
-        api_key_credential_provider_arn=api_key_credential_provider_arn,
+        openapi_s3_uri=s3_uri,
+        api_key_credential_provider_arn=provider_arn,
         api_key_param_name=api_key_param_name,
         api_key_location=api_key_location,
         description=description
     )
 
-    return response
+    return s3_uri, response
 
 
 @app.get("/health", response_model=HealthCheckResponse)
@@ -105,7 +456,7 @@ async def health_check():
 
 # Retrieves a specific gateway
 @app.get("/gateways/{gateway_id}", response_model=GetGatewayResponse)
-async def get_gateway(gateway_id: str):
+async def get_gateway(gateway_id: ResourceId):
     """
     Retrieve information about a specific gateway.
 
@@ -115,45 +466,21 @@ async def get_gateway(gateway_id: str):
     Returns:
         GetGatewayResponse with full gateway details
     """
-    try:
-        response = get_gateway_service(gateway_id=gateway_id)
+    cache_key = f"gw:item:{gateway_id}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
 
-        return GetGatewayResponse(
-            status="success",
-            message=f"Gateway '{response.get('name')}' retrieved successfully",
-            # AWS SDK response fields
-            gateway_id=response.get("gatewayId"),
-            gateway_url=response.get("gatewayUrl"),
-            gateway_arn=response.get("gatewayArn"),
-            name=response.get("name"),
-            description=response.get("description"),
-            created_at=response.get("createdAt"),
-            updated_at=response.get("updatedAt"),
-            gateway_status=response.get("status"),
-            status_reasons=response.get("statusReasons"),
-            authorizer_type=response.get("authorizerType"),
-            protocol_type=response.get("protocolType"),
-            role_arn=response.get("roleArn"),
-            authorizer_configuration=response.get("authorizerConfiguration"),
-            protocol_configuration=response.get("protocolConfiguration"),
-            exception_level=response.get("exceptionLevel"),
-            interceptor_configurations=response.get("interceptorConfigurations"),
-            policy_engine_configuration=response.get("policyEngineConfiguration"),
-            kms_key_arn=response.get("kmsKeyArn"),
-            workload_identity_details=response.get("workloadIdentityDetails")
-        )
+    response = await asyncio.to_thread(get_gateway_service, gateway_id=gateway_id)
+
+    result = _gateway_response(
+        GetGatewayResponse,
+        response,
+        f"Gateway '{response.get('name')}' retrieved successfully"
+    )
+    _cache_set(cache_key, result)
+    return result
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        print(f"Error retrieving gateway: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve gateway: {str(e)}"
-        )
 
 # Lists all gateways
 @app.get("/gateways", response_model=ListGatewaysResponse)
@@ -168,264 +495,137 @@ async def list_gateways(max_results: int = None, next_token: str = None):
     Returns:
         ListGatewaysResponse with gateway summaries and pagination token
     """
-    try:
-        # Validate max_results if provided
-        if max_results is not None:
-            if max_results < 1 or max_results > 1000:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="maxResults must be between 1 and 1000"
-                )
-
-        response = list_gateways_service(max_results=max_results, next_token=next_token)
-
-        # Transform items to match GatewaySummary model
-        items = [
-            GatewaySummary(
-                gateway_id=item.get("gatewayId"),
-                name=item.get("name"),
-                description=item.get("description"),
-                gateway_status=item.get("status"),
-                authorizer_type=item.get("authorizerType"),
-                protocol_type=item.get("protocolType"),
-                created_at=item.get("createdAt"),
-                updated_at=item.get("updatedAt")
+    cache_key = f"gw:list:{max_results}:{next_token}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Validate max_results if provided
+    if max_results is not None:
+        if max_results < 1 or max_results > 1000:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="maxResults must be between 1 and 1000"
             )
-            for item in response.get("items", [])
-        ]
 
-        return ListGatewaysResponse(
-            status="success",
-            message=f"Retrieved {len(items)} gateway(s)",
-            items=items,
-            next_token=response.get("nextToken")
-        )
+    response = await asyncio.to_thread(list_gateways_service, max_results=max_results, next_token=next_token)
+
+    # Transform items to match GatewaySummary model (one batch validate)
+    items = _GW_SUMMARY_ADAPTER.validate_python(
+        _project_rows(response.get("items", []), _GW_SUMMARY_FIELD_MAP)
+    )
+
+    result = ListGatewaysResponse(
+        status="success",
+        message=f"Retrieved {len(items)} gateway(s)",
+        items=items,
+        next_token=response.get("nextToken")
+    )
+    _cache_set(cache_key, result)
+    return result
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error listing gateways: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list gateways: {str(e)}"
-        )
 
 @app.post("/gateways", response_model=CreateGatewayResponse)
 async def create_gateway(request: CreateGatewayRequest):
     """Create a new gateways with provided authentication configuration"""
-    try:
-        # Validate required auth config
-        required_keys = ["client_id", "discovery_url"]
-        for key in required_keys:
-            if key not in request.auth_config.__dict__ or not getattr(request.auth_config, key):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Missing required auth_config field: {key}"
-                )
-
-        # Create IAM role
-        role_arn = create_agentcore_gateway_role("sample-lambdagateway-role-demo")
-
-        # Create or get gateways with JWT auth
-        auth_config = {
-            "client_id": request.auth_config.client_id,
-            "discovery_url": request.auth_config.discovery_url,
-        }
-        
-        gateway_info = create_gateway_service(
-            gateway_name=request.gateway_name,
-            role_arn=role_arn,
-            is_authenticated=True,
-            auth_config=auth_config,
-            description=request.description
-        )
-
-        return CreateGatewayResponse(
-            status="success",
-            message=f"Gateway '{request.gateway_name}' successfully created",
-            # AWS SDK response fields
-            gateway_id=gateway_info.get("gatewayId"),
-            gateway_url=gateway_info.get("gatewayUrl"),
-            gateway_arn=gateway_info.get("gatewayArn"),
-            name=gateway_info.get("name"),
-            description=gateway_info.get("description"),
-            created_at=gateway_info.get("createdAt"),
-            updated_at=gateway_info.get("updatedAt"),
-            gateway_status=gateway_info.get("status"),
-            status_reasons=gateway_info.get("statusReasons"),
-            authorizer_type=gateway_info.get("authorizerType"),
-            protocol_type=gateway_info.get("protocolType"),
-            role_arn=gateway_info.get("roleArn"),
-            authorizer_configuration=gateway_info.get("authorizerConfiguration"),
-            protocol_configuration=gateway_info.get("protocolConfiguration"),
-            exception_level=gateway_info.get("exceptionLevel"),
-            interceptor_configurations=gateway_info.get("interceptorConfigurations"),
-            policy_engine_configuration=gateway_info.get("policyEngineConfiguration"),
-            kms_key_arn=gateway_info.get("kmsKeyArn"),
-            workload_identity_details=gateway_info.get("workloadIdentityDetails")
-        )
+    # auth_config.client_id and discovery_url are required (non-Optional)
+    # on CognitoAuthConfig, so Pydantic already rejects missing/empty
+    # payloads with a 422 before the handler runs.
+
+    # Resolve IAM role (cached after the first request)
+    role_arn = await _get_gateway_role_arn()
+
+    # Create or get gateways with JWT auth
+    auth_config = {
+        "client_id": request.auth_config.client_id,
+        "discovery_url": request.auth_config.discovery_url,
+    }
+
+    gateway_info = await asyncio.to_thread(
+        create_gateway_service,
+        gateway_name=request.gateway_name,
+        role_arn=role_arn,
+        is_authenticated=True,
+        auth_config=auth_config,
+        description=request.description
+    )
+    _cache_invalidate("gw:")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error creating gateways: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create gateways: {str(e)}"
-        )
+    return _gateway_response(
+        CreateGatewayResponse,
+        gateway_info,
+        f"Gateway '{request.gateway_name}' successfully created"
+    )
 
 
 @app.post("/gateways/no-auth", response_model=CreateGatewayResponse)
 async def create_gateway_no_auth(request: CreateGatewayNoAuthRequest):
     """Create a new gateways without authentication"""
-    try:
-        # Create IAM role
-        role_arn = create_agentcore_gateway_role("sample-lambdagateway-role-demo")
-
-        # Create or get gateways without auth
-        gateway_info = create_gateway_service(
-            gateway_name=request.gateway_name,
-            role_arn=role_arn,
-            is_authenticated=False,
-            description=request.description
-        )
-
-        return CreateGatewayResponse(
-            status="success",
-            message=f"Gateway '{request.gateway_name}' successfully created without authentication",
-            # AWS SDK response fields
-            gateway_id=gateway_info.get("gatewayId"),
-            gateway_url=gateway_info.get("gatewayUrl"),
-            gateway_arn=gateway_info.get("gatewayArn"),
-            name=gateway_info.get("name"),
-            description=gateway_info.get("description"),
-            created_at=gateway_info.get("createdAt"),
-            updated_at=gateway_info.get("updatedAt"),
-            gateway_status=gateway_info.get("status"),
-            status_reasons=gateway_info.get("statusReasons"),
-            authorizer_type=gateway_info.get("authorizerType"),
-            protocol_type=gateway_info.get("protocolType"),
-            role_arn=gateway_info.get("roleArn"),
-            authorizer_configuration=gateway_info.get("authorizerConfiguration"),
-            protocol_configuration=gateway_info.get("protocolConfiguration"),
-            exception_level=gateway_info.get("exceptionLevel"),
-            interceptor_configurations=gateway_info.get("interceptorConfigurations"),
-            policy_engine_configuration=gateway_info.get("policyEngineConfiguration"),
-            kms_key_arn=gateway_info.get("kmsKeyArn"),
-            workload_identity_details=gateway_info.get("workloadIdentityDetails")
-        )
+    # Resolve IAM role (cached after the first request)
+    role_arn = await _get_gateway_role_arn()
+
+    # Create or get gateways without auth
+    gateway_info = await asyncio.to_thread(
+        create_gateway_service,
+        gateway_name=request.gateway_name,
+        role_arn=role_arn,
+        is_authenticated=False,
+        description=request.description
+    )
+    _cache_invalidate("gw:")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error creating gateways (no auth): {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create gateways: {str(e)}"
-        )
+    return _gateway_response(
+        CreateGatewayResponse,
+        gateway_info,
+        f"Gateway '{request.gateway_name}' successfully created without authentication"
+    )
 
 
 # Updates an existing gateway
 @app.put("/gateways/{gateway_id}", response_model=UpdateGatewayResponse)
-async def update_gateway(gateway_id: str, request: UpdateGatewayRequest):
+async def update_gateway(gateway_id: ResourceId, request: UpdateGatewayRequest):
     """Update an existing gateway"""
-    try:
-        name = request.name
-        protocol_type = request.protocol_type
-        authorizer_type = request.authorizer_type
-        role_arn = request.role_arn
-        description = request.description
-
-        # Validate required parameters
-        if authorizer_type not in ["CUSTOM_JWT", "AWS_IAM", "NONE"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="authorizer_type must be one of: CUSTOM_JWT, AWS_IAM, NONE"
-            )
-
-        if protocol_type != "MCP":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="protocol_type must be MCP"
-            )
+    name = request.name
 
-        response = update_gateway_service(
-            gateway_id=gateway_id,
-            name=name,
-            protocol_type=protocol_type,
-            authorizer_type=authorizer_type,
-            role_arn=role_arn,
-            description=description
-        )
-
-        return UpdateGatewayResponse(
-            status="success",
-            message=f"Gateway '{name}' successfully updated",
-            # AWS SDK response fields
-            gateway_id=response.get("gatewayId"),
-            gateway_url=response.get("gatewayUrl"),
-            gateway_arn=response.get("gatewayArn"),
-            name=response.get("name"),
-            description=response.get("description"),
-            created_at=response.get("createdAt"),
-            updated_at=response.get("updatedAt"),
-            gateway_status=response.get("status"),
-            status_reasons=response.get("statusReasons"),
-            authorizer_type=response.get("authorizerType"),
-            protocol_type=response.get("protocolType"),
-            role_arn=response.get("roleArn"),
-            authorizer_configuration=response.get("authorizerConfiguration"),
-            protocol_configuration=response.get("protocolConfiguration"),
-            exception_level=response.get("exceptionLevel"),
-            interceptor_configurations=response.get("interceptorConfigurations"),
-            policy_engine_configuration=response.get("policyEngineConfiguration"),
-            kms_key_arn=response.get("kmsKeyArn"),
-            workload_identity_details=response.get("workloadIdentityDetails")
-        )
+    # protocol_type and authorizer_type are Literal fields on
+    # UpdateGatewayRequest, so invalid values are rejected with a 422
+    # before the handler runs.
+    response = await asyncio.to_thread(
+        update_gateway_service,
+        gateway_id=gateway_id,
+        name=name,
+        protocol_type=request.protocol_type,
+        authorizer_type=request.authorizer_type,
+        role_arn=request.role_arn,
+        description=request.description
+    )
+    _cache_invalidate("gw:")
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error updating gateway: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update gateway: {str(e)}"
-        )
+    return _gateway_response(
+        UpdateGatewayResponse,
+        response,
+        f"Gateway '{name}' successfully updated"
+    )
 
 
 # Deletes an existing gateway
 @app.delete("/gateways/{gateway_id}", response_model=DeleteGatewayResponse, status_code=status.HTTP_202_ACCEPTED)
-async def delete_gateway(gateway_id: str):
+async def delete_gateway(gateway_id: ResourceId):
     """Delete an existing gateway"""
-    try:
-        delete_gateway_service(gateway_id=gateway_id)
+    await asyncio.to_thread(delete_gateway_service, gateway_id=gateway_id)
+    _cache_invalidate("gw:")
+    _cache_invalidate(f"tools:{gateway_id}")
 
-        return DeleteGatewayResponse(
-            gateway_id=gateway_id,
-            status="DELETING"
-        )
-    except Exception as e:
-        print(f"Error deleting gateway: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete gateway: {str(e)}"
-        )
+    return DeleteGatewayResponse(
+        gateway_id=gateway_id,
+        status="DELETING"
+    )
 
 ## Tools
 
 # Retrieves a specific gateway tool (target)
 @app.get("/gateways/{gateway_id}/tools/{target_id}", response_model=GetGatewayTargetResponse)
-async def get_tool(gateway_id: str, target_id: str):
+async def get_tool(gateway_id: ResourceId, target_id: ResourceId):
     """
     Retrieve information about a specific gateway target (tool).
 
@@ -436,42 +636,36 @@ async def get_tool(gateway_id: str, target_id: str):
     Returns:
         GetGatewayTargetResponse with full target details
     """
-    try:
-        response = get_gateway_target(gateway_id=gateway_id, target_id=target_id)
-
-        return GetGatewayTargetResponse(
-            status="success",
-            message=f"Gateway target '{response.get('name')}' retrieved successfully",
-            # AWS SDK response fields
-            target_id=response.get("targetId"),
-            name=response.get("name"),
-            description=response.get("description"),
-            gateway_arn=response.get("gatewayArn"),
-            created_at=response.get("createdAt"),
-            updated_at=response.get("updatedAt"),
-            last_synchronized_at=response.get("lastSynchronizedAt"),
-            target_status=response.get("status"),
-            status_reasons=response.get("statusReasons"),
-            target_configuration=response.get("targetConfiguration"),
-            credential_provider_configurations=response.get("credentialProviderConfigurations")
-        )
-
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        print(f"Error retrieving gateway target: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve gateway target: {str(e)}"
-        )
+    cache_key = f"tools:{gateway_id}:item:{target_id}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    response = await asyncio.to_thread(get_gateway_target, gateway_id=gateway_id, target_id=target_id)
+
+    result = GetGatewayTargetResponse(
+        status="success",
+        message=f"Gateway target '{response.get('name')}' retrieved successfully",
+        # AWS SDK response fields
+        target_id=response.get("targetId"),
+        name=response.get("name"),
+        description=response.get("description"),
+        gateway_arn=response.get("gatewayArn"),
+        created_at=response.get("createdAt"),
+        updated_at=response.get("updatedAt"),
+        last_synchronized_at=response.get("lastSynchronizedAt"),
+        target_status=response.get("status"),
+        status_reasons=response.get("statusReasons"),
+        target_configuration=response.get("targetConfiguration"),
+        credential_provider_configurations=response.get("credentialProviderConfigurations")
+    )
+    _cache_set(cache_key, result)
+    return result
 
 
 # Lists all gateway targets (tools) for a gateway
 @app.get("/gateways/{gateway_id}/tools", response_model=ListGatewayTargetsResponse)
-async def list_tools(gateway_id: str, max_results: int = None, next_token: str = None):
+async def list_tools(gateway_id: ResourceId, max_results: int = None, next_token: str = None):
     """
     List all targets (tools) for a specific gateway.
 
@@ -483,50 +677,36 @@ async def list_tools(gateway_id: str, max_results: int = None, next_token: str =
     Returns:
         ListGatewayTargetsResponse with target summaries and pagination token
     """
-    try:
-        # Validate max_results if provided
-        if max_results is not None:
-            if max_results < 1 or max_results > 1000:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="maxResults must be between 1 and 1000"
-                )
-
-        response = list_gateway_targets(gateway_id=gateway_id, max_results=max_results, next_token=next_token)
-
-        # Transform items to TargetSummary objects
-        items = [
-            TargetSummary(
-                target_id=item.get("targetId"),
-                name=item.get("name"),
-                description=item.get("description"),
-                target_status=item.get("status"),
-                created_at=item.get("createdAt"),
-                updated_at=item.get("updatedAt")
+    cache_key = f"tools:{gateway_id}:list:{max_results}:{next_token}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Validate max_results if provided
+    if max_results is not None:
+        if max_results < 1 or max_results > 1000:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="maxResults must be between 1 and 1000"
             )
-            for item in response.get("items", [])
-        ]
 
-        return ListGatewayTargetsResponse(
-            status="success",
-            message=f"Retrieved {len(items)} target(s)",
-            items=items,
-            next_token=response.get("nextToken")
-        )
+    response = await asyncio.to_thread(
+        list_gateway_targets, gateway_id=gateway_id, max_results=max_results, next_token=next_token
+    )
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error listing gateway targets: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list gateway targets: {str(e)}"
-        )
+    # Transform items to TargetSummary objects (one batch validate)
+    items = _TARGET_SUMMARY_ADAPTER.validate_python(
+        _project_rows(response.get("items", []), _TARGET_SUMMARY_FIELD_MAP)
+    )
+
+    result = ListGatewayTargetsResponse(
+        status="success",
+        message=f"Retrieved {len(items)} target(s)",
+        items=items,
+        next_token=response.get("nextToken")
+    )
+    _cache_set(cache_key, result)
+    return result
 
 
 # Creates tool from uploaded OpenAPI spec file
@@ -538,283 +718,351 @@ async def create_tool(
     auth: str = Form(...),  # JSON string of Auth object
 ):
     """Create a new tool on the gateways"""
-    try:
-        # Parse auth JSON
-        import json as json_module
-        auth_obj: Auth = Auth.model_validate(json_module.loads(auth))
-
-        # Validate auth configuration
-        validate_auth(auth_obj)
-
-        # Validate OpenAPI spec file
-        if not openapi_spec_file.filename:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="OpenAPI spec file is required"
-            )
-
-        if not openapi_spec_file.filename.endswith(".json"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="OpenAPI spec file must be a JSON file"
-            )
-
-        # Read and validate OpenAPI spec
-        spec_content = await openapi_spec_file.read()
-        try:
-            spec_json = json.loads(spec_content)
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid JSON in OpenAPI spec file"
-            )
-
-        # Basic OpenAPI validation
-        if "openapi" not in spec_json and "swagger" not in spec_json:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="OpenAPI spec must contain 'openapi' or 'swagger' field"
-            )
-
-        # Upload OpenAPI spec to S3 directly (in-memory)
-        s3_uri = upload_openapi_spec(spec_json, tool_name, gateway_id, bucket_name=OPENAPI_SPECS_BUCKET)
-
-        # Register tool with gateways
-        result = _register_tool_with_gateway(
-            gateway_id=gateway_id,
-            target_name=tool_name,
-            openapi_s3_uri=s3_uri,
-            auth=auth_obj,
-            description=None
-        )
-
-        return CreateToolResponse(
-            status="success",
-            tool_name=tool_name,
-            gateway_id=gateway_id,
-            openapi_spec_path=str(s3_uri),
-            message=f"Tool '{tool_name}' successfully created and registered on gateways {gateway_id}",
-            # AWS SDK response fields
-            target_id=result.get("targetId"),
-            gateway_arn=result.get("gatewayArn"),
-            description=result.get("description"),
-            created_at=result.get("createdAt"),
-            updated_at=result.get("updatedAt"),
-            last_synchronized_at=result.get("lastSynchronizedAt"),
-            target_status=result.get("status"),
-            status_reasons=result.get("statusReasons"),
-            target_configuration=result.get("targetConfiguration"),
-            credential_provider_configurations=result.get("credentialProviderConfigurations")
-        )
+    # Parse auth JSON
+    auth_obj: Auth = _AUTH_ADAPTER.validate_json(auth)
+
+    # Validate auth configuration
+    validate_auth(auth_obj)
+
+    # Validate OpenAPI spec file
+    if not openapi_spec_file.filename:
+        raise _ERR_NO_FILENAME
+
+    if not openapi_spec_file.filename.endswith(".json"):
+        raise _ERR_NOT_JSON
+
+    # Read the upload in chunks, running the cheap marker scan as bytes
+    # arrive instead of buffering the whole body before validating.
+    # A small tail is kept so a marker split across a chunk boundary
+    # is still found.
+    spec_buffer = io.BytesIO()
+    has_openapi_marker = False
+    tail = b""
+    while chunk := await openapi_spec_file.read(128 * 1024):
+        spec_buffer.write(chunk)
+        if not has_openapi_marker:
+            window = tail + chunk
+            if _has_openapi_marker(window):
+                has_openapi_marker = True
+            else:
+                tail = chunk[-32:]
+
+    # Basic OpenAPI validation - cheap bytes-level scan instead of parsing
+    # the full document just to check two top-level keys (the bytes are
+    # uploaded as-is, so the parsed dict is never needed downstream)
+    if not has_openapi_marker:
+        raise _ERR_NO_OPENAPI_KEY
+
+    # Stream the buffered spec to S3 (multipart for large files) while the
+    # credential provider is resolved concurrently, then create the target
+    spec_buffer.seek(0)
+    s3_uri, result = await _register_tool_with_gateway(
+        gateway_id=gateway_id,
+        target_name=tool_name,
+        upload=functools.partial(
+            upload_openapi_spec_fileobj, spec_buffer, tool_name, gateway_id, bucket_name=OPENAPI_SPECS_BUCKET
+        ),
+        auth=auth_obj,
+        description=None
+    )
+    _cache_invalidate(f"tools:{gateway_id}")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error creating tool: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create tool: {str(e)}"
-        )
+    return CreateToolResponse(
+        status="success",
+        tool_name=tool_name,
+        gateway_id=gateway_id,
+        openapi_spec_path=s3_uri,
+        message=_tool_created_msg(tool_name, gateway_id),
+        # AWS SDK response fields
+        target_id=result.get("targetId"),
+        gateway_arn=result.get("gatewayArn"),
+        description=result.get("description"),
+        created_at=result.get("createdAt"),
+        updated_at=result.get("updatedAt"),
+        last_synchronized_at=result.get("lastSynchronizedAt"),
+        target_status=result.get("status"),
+        status_reasons=result.get("statusReasons"),
+        target_configuration=result.get("targetConfiguration"),
+        credential_provider_configurations=result.get("credentialProviderConfigurations")
+    )
 
 
 # Creates tool from uploaded OpenAPI spec file url
 @app.post("/tools/from-url", response_model=CreateToolResponse)
 async def create_tool_from_url(request: CreateToolFromUrlRequest):
     """Create a new tool on the gateways from an OpenAPI spec URL"""
-    try:
-        # Validate auth configuration
-        validate_auth(request.auth)
-
-        # Download OpenAPI spec from URL
-        print(f"Downloading OpenAPI spec from {request.openapi_spec_url}")
-        response = requests.get(request.openapi_spec_url, timeout=10)
+    # Validate auth configuration
+    validate_auth(request.auth)
+
+    # Download the OpenAPI spec in chunks, running the cheap marker scan
+    # as bytes arrive instead of buffering the whole body first (the
+    # downloaded bytes are uploaded as-is, so the parsed dict is never
+    # needed). A small tail catches markers split across chunks.
+    logger.info("Downloading OpenAPI spec from %s", request.openapi_spec_url)
+    spec_buffer = io.BytesIO()
+    has_openapi_marker = False
+    tail = b""
+    async with _http.stream("GET", request.openapi_spec_url) as response:
         response.raise_for_status()
-
-        try:
-            spec_json = response.json()
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid JSON in OpenAPI spec from URL"
-            )
-
-        # Validate OpenAPI spec
-        if "openapi" not in spec_json and "swagger" not in spec_json:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="OpenAPI spec must contain 'openapi' or 'swagger' field"
-            )
-
-        # Upload to S3 and register tool with gateways
-        s3_uri = upload_openapi_spec(spec_json, request.tool_name, request.gateway_id, bucket_name=OPENAPI_SPECS_BUCKET)
-
-        # Register tool with gateways
-        result = _register_tool_with_gateway(
-            gateway_id=request.gateway_id,
-            target_name=request.tool_name,
-            openapi_s3_uri=s3_uri,
-            auth=request.auth,
-            description=None
-        )
-
-        return CreateToolResponse(
-            status="success",
-            tool_name=request.tool_name,
-            gateway_id=request.gateway_id,
-            openapi_spec_path=str(s3_uri),
-            message=f"Tool '{request.tool_name}' successfully created and registered on gateways {request.gateway_id}",
-            # AWS SDK response fields
-            target_id=result.get("targetId"),
-            gateway_arn=result.get("gatewayArn"),
-            description=result.get("description"),
-            created_at=result.get("createdAt"),
-            updated_at=result.get("updatedAt"),
-            last_synchronized_at=result.get("lastSynchronizedAt"),
-            target_status=result.get("status"),
-            status_reasons=result.get("statusReasons"),
-            target_configuration=result.get("targetConfiguration"),
-            credential_provider_configurations=result.get("credentialProviderConfigurations")
-        )
-
-    except HTTPException:
-        raise
-    except requests.RequestException as e:
-        print(f"Error downloading OpenAPI spec: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to download OpenAPI spec from URL: {str(e)}"
-        )
-    except Exception as e:
-        print(f"Error creating tool from URL: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create tool: {str(e)}"
-        )
+        async for chunk in response.aiter_bytes(128 * 1024):
+            spec_buffer.write(chunk)
+            if not has_openapi_marker:
+                window = tail + chunk
+                if _has_openapi_marker(window):
+                    has_openapi_marker = True
+                else:
+                    tail = chunk[-32:]
+
+    if not has_openapi_marker:
+        raise _ERR_NO_OPENAPI_KEY
+
+    # Stream the buffered spec to S3 (multipart for large files) while the
+    # credential provider is resolved concurrently, then create the target
+    spec_buffer.seek(0)
+    s3_uri, result = await _register_tool_with_gateway(
+        gateway_id=request.gateway_id,
+        target_name=request.tool_name,
+        upload=functools.partial(
+            upload_openapi_spec_fileobj, spec_buffer, request.tool_name, request.gateway_id, bucket_name=OPENAPI_SPECS_BUCKET
+        ),
+        auth=request.auth,
+        description=None
+    )
+    _cache_invalidate(f"tools:{request.gateway_id}")
+
+    return CreateToolResponse(
+        status="success",
+        tool_name=request.tool_name,
+        gateway_id=request.gateway_id,
+        openapi_spec_path=s3_uri,
+        message=_tool_created_msg(request.tool_name, request.gateway_id),
+        # AWS SDK response fields
+        target_id=result.get("targetId"),
+        gateway_arn=result.get("gatewayArn"),
+        description=result.get("description"),
+        created_at=result.get("createdAt"),
+        updated_at=result.get("updatedAt"),
+        last_synchronized_at=result.get("lastSynchronizedAt"),
+        target_status=result.get("status"),
+        status_reasons=result.get("statusReasons"),
+        target_configuration=result.get("targetConfiguration"),
+        credential_provider_configurations=result.get("credentialProviderConfigurations")
+    )
 
 
 # Creates tool from minimal API info. (System creates an OpenAPI spec on the fly)
 @app.post("/tools/from-api-info", response_model=CreateToolResponse)
 async def create_tool_from_api_info(request: CreateToolFromApiInfoRequest):
     """Create a new tool on the gateways from manual API information"""
-    try:
-        # Validate auth configuration
-        validate_auth(request.auth)
-
-        # Generate OpenAPI spec from API info
-        spec_json = generate_openapi_spec(
-            tool_name=request.tool_name,
-            method=request.api_info.method,
-            url=request.api_info.url,
-            query_params=request.api_info.query_params,
-            headers=request.api_info.headers,
-            body_schema=request.api_info.body_schema,
-            description=request.api_info.description
-        )
-
-        # Upload generated spec to S3
-        s3_uri = upload_openapi_spec(spec_json, request.tool_name, request.gateway_id, bucket_name=OPENAPI_SPECS_BUCKET)
-
-        # Register tool with gateways
-        result = _register_tool_with_gateway(
-            gateway_id=request.gateway_id,
-            target_name=request.tool_name,
-            openapi_s3_uri=s3_uri,
-            auth=request.auth,
-            description=request.api_info.description
-        )
-
-        return CreateToolResponse(
-            status="success",
-            tool_name=request.tool_name,
-            gateway_id=request.gateway_id,
-            openapi_spec_path=str(s3_uri),
-            message=f"Tool '{request.tool_name}' successfully created and registered on gateways {request.gateway_id}",
-            # AWS SDK response fields
-            target_id=result.get("targetId"),
-            gateway_arn=result.get("gatewayArn"),
-            description=result.get("description"),
-            created_at=result.get("createdAt"),
-            updated_at=result.get("updatedAt"),
-            last_synchronized_at=result.get("lastSynchronizedAt"),
-            target_status=result.get("status"),
-            status_reasons=result.get("statusReasons"),
-            target_configuration=result.get("targetConfiguration"),
-            credential_provider_configurations=result.get("credentialProviderConfigurations")
-        )
+    # Validate auth configuration
+    validate_auth(request.auth)
+
+    # Generate OpenAPI spec from API info
+    spec_json = generate_openapi_spec(
+        tool_name=request.tool_name,
+        method=request.api_info.method,
+        url=request.api_info.url,
+        query_params=request.api_info.query_params,
+        headers=request.api_info.headers,
+        body_schema=request.api_info.body_schema,
+        description=request.api_info.description
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error creating tool from API info: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create tool: {str(e)}"
-        )
+    # Upload the generated spec to S3 while the credential provider is
+    # resolved concurrently, then create the target
+    s3_uri, result = await _register_tool_with_gateway(
+        gateway_id=request.gateway_id,
+        target_name=request.tool_name,
+        upload=functools.partial(
+            upload_openapi_spec, spec_json, request.tool_name, request.gateway_id, bucket_name=OPENAPI_SPECS_BUCKET
+        ),
+        auth=request.auth,
+        description=request.api_info.description
+    )
+    _cache_invalidate(f"tools:{request.gateway_id}")
+
+    return CreateToolResponse(
+        status="success",
+        tool_name=request.tool_name,
+        gateway_id=request.gateway_id,
+        openapi_spec_path=s3_uri,
+        message=_tool_created_msg(request.tool_name, request.gateway_id),
+        # AWS SDK response fields
+        target_id=result.get("targetId"),
+        gateway_arn=result.get("gatewayArn"),
+        description=result.get("description"),
+        created_at=result.get("createdAt"),
+        updated_at=result.get("updatedAt"),
+        last_synchronized_at=result.get("lastSynchronizedAt"),
+        target_status=result.get("status"),
+        status_reasons=result.get("statusReasons"),
+        target_configuration=result.get("targetConfiguration"),
+        credential_provider_configurations=result.get("credentialProviderConfigurations")
+    )
 
 
 # Creates tool from JSON OpenAPI spec in payload
 @app.post("/tools/from-spec", response_model=CreateToolResponse)
 async def create_tool_from_spec(request: CreateToolFromSpecRequest):
     """Create a new tool on the gateways from an inline OpenAPI spec definition"""
-    try:
-        # Validate auth configuration
-        validate_auth(request.auth)
+    # Validate auth configuration
+    validate_auth(request.auth)
+
+    spec_json = request.openapi_spec
+
+    # Validate OpenAPI spec (compiled Rust-backed structural check)
+    validate_openapi_spec(spec_json)
+
+    # Serialize once with orjson and hand the bytes straight to the S3
+    # pass-through path, so the upload worker never re-walks the dict
+    spec_bytes = orjson.dumps(spec_json)
+
+    # Upload the inline spec to S3 while the credential provider is
+    # resolved concurrently, then create the target
+    s3_uri, result = await _register_tool_with_gateway(
+        gateway_id=request.gateway_id,
+        target_name=request.tool_name,
+        upload=functools.partial(
+            upload_openapi_spec, spec_bytes, request.tool_name, request.gateway_id, bucket_name=OPENAPI_SPECS_BUCKET
+        ),
+        auth=request.auth,
+        description=None
+    )
+    _cache_invalidate(f"tools:{request.gateway_id}")
+
+    return CreateToolResponse(
+        status="success",
+        tool_name=request.tool_name,
+        gateway_id=request.gateway_id,
+        openapi_spec_path=s3_uri,
+        message=_tool_created_msg(request.tool_name, request.gateway_id),
+        # AWS SDK response fields
+        target_id=result.get("targetId"),
+        gateway_arn=result.get("gatewayArn"),
+        description=result.get("description"),
+        created_at=result.get("createdAt"),
+        updated_at=result.get("updatedAt"),
+        last_synchronized_at=result.get("lastSynchronizedAt"),
+        target_status=result.get("status"),
+        status_reasons=result.get("statusReasons"),
+        target_configuration=result.get("targetConfiguration"),
+        credential_provider_configurations=result.get("credentialProviderConfigurations")
+    )
 
-        spec_json = request.openapi_spec
 
-        # Validate OpenAPI spec
-        if "openapi" not in spec_json and "swagger" not in spec_json:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="OpenAPI spec must contain 'openapi' or 'swagger' field"
-            )
+# In-process store for asynchronous tool-creation results, bounded so
+# abandoned operations cannot grow it without limit. Oldest entries are
+# evicted first (dicts preserve insertion order).
+_ASYNC_OPS_MAX = 1024
+_async_operations: dict[str, OperationStatusResponse] = {}
+
 
-        # Upload the inline spec to S3
-        s3_uri = upload_openapi_spec(spec_json, request.tool_name, request.gateway_id, bucket_name=OPENAPI_SPECS_BUCKET)
+def _record_operation(operation: OperationStatusResponse) -> None:
+    """Store an operation status, evicting the oldest entries past the cap."""
+    _async_operations[operation.operation_id] = operation
+    while len(_async_operations) > _ASYNC_OPS_MAX:
+        _async_operations.pop(next(iter(_async_operations)))
 
-        # Register tool with gateways
-        result = _register_tool_with_gateway(
+
+async def _finish_async_registration(operation_id: str, request: CreateToolFromSpecRequest, s3_uri: str) -> None:
+    """Complete a fire-and-forget registration: resolve credentials, create the target."""
+    try:
+        provider_arn, api_key_param_name, api_key_location = await asyncio.to_thread(
+            _resolve_credential_provider, request.tool_name, request.auth
+        )
+        result = await _create_target_batched(
             gateway_id=request.gateway_id,
             target_name=request.tool_name,
             openapi_s3_uri=s3_uri,
-            auth=request.auth,
+            api_key_credential_provider_arn=provider_arn,
+            api_key_param_name=api_key_param_name,
+            api_key_location=api_key_location,
             description=None
         )
-
-        return CreateToolResponse(
+        _cache_invalidate(f"tools:{request.gateway_id}")
+        _record_operation(OperationStatusResponse(
+            operation_id=operation_id,
             status="success",
-            tool_name=request.tool_name,
-            gateway_id=request.gateway_id,
-            openapi_spec_path=str(s3_uri),
-            message=f"Tool '{request.tool_name}' successfully created and registered on gateways {request.gateway_id}",
-            # AWS SDK response fields
-            target_id=result.get("targetId"),
-            gateway_arn=result.get("gatewayArn"),
-            description=result.get("description"),
-            created_at=result.get("createdAt"),
-            updated_at=result.get("updatedAt"),
-            last_synchronized_at=result.get("lastSynchronizedAt"),
-            target_status=result.get("status"),
-            status_reasons=result.get("statusReasons"),
-            target_configuration=result.get("targetConfiguration"),
-            credential_provider_configurations=result.get("credentialProviderConfigurations")
-        )
-
-    except HTTPException:
-        raise
+            result=CreateToolResponse(
+                status="success",
+                tool_name=request.tool_name,
+                gateway_id=request.gateway_id,
+                openapi_spec_path=s3_uri,
+                message=_tool_created_msg(request.tool_name, request.gateway_id),
+                target_id=result.get("targetId"),
+                gateway_arn=result.get("gatewayArn"),
+                description=result.get("description"),
+                created_at=result.get("createdAt"),
+                updated_at=result.get("updatedAt"),
+                last_synchronized_at=result.get("lastSynchronizedAt"),
+                target_status=result.get("status"),
+                status_reasons=result.get("statusReasons"),
+                target_configuration=result.get("targetConfiguration"),
+                credential_provider_configurations=result.get("credentialProviderConfigurations")
+            )
+        ))
     except Exception as e:
-        print(f"Error creating tool from spec: {str(e)}")
+        logger.exception("Error completing async tool registration %s", operation_id)
+        _record_operation(OperationStatusResponse(
+            operation_id=operation_id,
+            status="error",
+            detail=str(e)
+        ))
+
+
+# Creates tool from JSON OpenAPI spec without waiting on target registration
+@app.post("/tools/from-spec/async", response_model=AsyncCreateToolResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_tool_from_spec_async(request: CreateToolFromSpecRequest):
+    """
+    Create a tool from an inline OpenAPI spec, returning as soon as the spec
+    is uploaded to S3.
+
+    The slow AgentCore target registration runs in the background; poll
+    GET /operations/{operation_id} for the final result.
+    """
+    validate_auth(request.auth)
+
+    spec_json = request.openapi_spec
+    validate_openapi_spec(spec_json)
+    spec_bytes = orjson.dumps(spec_json)
+
+    # The spec must be durably in S3 before AgentCore can pull it, so the
+    # upload stays on the request path; only the control-plane call is deferred
+    s3_uri = await asyncio.to_thread(
+        upload_openapi_spec, spec_bytes, request.tool_name, request.gateway_id, bucket_name=OPENAPI_SPECS_BUCKET
+    )
+
+    operation_id = uuid.uuid4().hex
+    _record_operation(OperationStatusResponse(operation_id=operation_id, status="pending"))
+    asyncio.create_task(_finish_async_registration(operation_id, request, s3_uri))
+
+    return AsyncCreateToolResponse(
+        status="accepted",
+        operation_id=operation_id,
+        tool_name=request.tool_name,
+        gateway_id=request.gateway_id,
+        openapi_spec_path=s3_uri,
+        message=f"Tool '{request.tool_name}' registration started on gateways {request.gateway_id}"
+    )
+
+
+@app.get("/operations/{operation_id}", response_model=OperationStatusResponse)
+async def get_operation(operation_id: ResourceId):
+    """Return the status of an asynchronous tool-creation operation"""
+    operation = _async_operations.get(operation_id)
+    if operation is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create tool: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Operation '{operation_id}' not found"
         )
+    return operation
 
 
 # Updates tool (target) on gateways
 @app.put("/gateways/{gateway_id}/tools/{target_id}", response_model=UpdateToolResponse)
 async def update_tool(
-    gateway_id: str,
-    target_id: str,
+    gateway_id: ResourceId,
+    target_id: ResourceId,
     request: UpdateToolRequest
 ):
     """
@@ -836,50 +1084,39 @@ async def update_tool(
         For gateways without authentication, credential_provider_configurations can be omitted.
         The service will automatically preserve existing credential configurations if not provided.
     """
-    try:
-        response = update_gateway_target(
-            gateway_id=gateway_id,
-            target_id=target_id,
-            target_name=request.target_name,
-            target_configuration=request.target_configuration,
-            credential_provider_configurations=request.credential_provider_configurations,
-            description=request.description
-        )
-
-        return UpdateToolResponse(
-            status="success",
-            tool_name=request.target_name,
-            target_id=response.get("targetId", target_id),
-            gateway_id=gateway_id,
-            message=f"Tool '{request.target_name}' (target {target_id}) successfully updated on gateways '{gateway_id}'",
-            # AWS SDK response fields
-            gateway_arn=response.get("gatewayArn"),
-            description=response.get("description"),
-            created_at=response.get("createdAt"),
-            updated_at=response.get("updatedAt"),
-            last_synchronized_at=response.get("lastSynchronizedAt"),
-            target_status=response.get("status"),
-            status_reasons=response.get("statusReasons"),
-            target_configuration=response.get("targetConfiguration"),
-            credential_provider_configurations=response.get("credentialProviderConfigurations")
-        )
+    response = await asyncio.to_thread(
+        update_gateway_target,
+        gateway_id=gateway_id,
+        target_id=target_id,
+        target_name=request.target_name,
+        target_configuration=request.target_configuration,
+        credential_provider_configurations=request.credential_provider_configurations,
+        description=request.description
+    )
+    _cache_invalidate(f"tools:{gateway_id}")
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        print(f"Error updating tool: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update tool: {str(e)}"
-        )
+    return UpdateToolResponse(
+        status="success",
+        tool_name=request.target_name,
+        target_id=response.get("targetId", target_id),
+        gateway_id=gateway_id,
+        message=f"Tool '{request.target_name}' (target {target_id}) successfully updated on gateways '{gateway_id}'",
+        # AWS SDK response fields
+        gateway_arn=response.get("gatewayArn"),
+        description=response.get("description"),
+        created_at=response.get("createdAt"),
+        updated_at=response.get("updatedAt"),
+        last_synchronized_at=response.get("lastSynchronizedAt"),
+        target_status=response.get("status"),
+        status_reasons=response.get("statusReasons"),
+        target_configuration=response.get("targetConfiguration"),
+        credential_provider_configurations=response.get("credentialProviderConfigurations")
+    )
 
 
 # Deletes tool (target) from gateway - A target can be 1 tool or multiple tools
 @app.delete("/gateways/{gateway_id}/tools/{target_id}", response_model=DeleteToolResponse)
-async def delete_tool(gateway_id: str, target_id: str):
+async def delete_tool(gateway_id: ResourceId, target_id: ResourceId):
     """
     Delete a tool (target) from a gateways.
 
@@ -890,44 +1127,59 @@ async def delete_tool(gateway_id: str, target_id: str):
     Returns:
         DeleteToolResponse with deletion status
     """
-    try:
-        response = delete_gateway_target(
-            gateway_id=gateway_id,
-            target_id=target_id
-        )
-
-        return DeleteToolResponse(
-            status=response.get("status", "DELETING"),
-            target_id=response.get("targetId", target_id),
-            gateway_id=gateway_id,
-            gateway_arn=response.get("gatewayArn"),
-            status_reasons=response.get("statusReasons"),
-            message=f"Tool '{target_id}' deletion initiated on gateways '{gateway_id}'"
-        )
+    response = await asyncio.to_thread(
+        delete_gateway_target,
+        gateway_id=gateway_id,
+        target_id=target_id
+    )
+    _cache_invalidate(f"tools:{gateway_id}")
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        print(f"Error deleting tool: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete tool: {str(e)}"
-        )
+    return DeleteToolResponse(
+        status=response.get("status", "DELETING"),
+        target_id=response.get("targetId", target_id),
+        gateway_id=gateway_id,
+        gateway_arn=response.get("gatewayArn"),
+        status_reasons=response.get("statusReasons"),
+        message=f"Tool '{target_id}' deletion initiated on gateways '{gateway_id}'"
+    )
 
 
 if __name__ == "__main__":
+    import logging.handlers
+    import multiprocessing
+    import queue
     import uvicorn
 
-    print("Starting AgentCore Gateway Tools API...")
-    print(f"OpenAPI specs bucket: {OPENAPI_SPECS_BUCKET}")
-    print(f"AWS Region: {AWS_REGION}")
+    # Push log records through a queue so formatting and stdout writes happen
+    # on a background thread instead of blocking the request path
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+
+    logger.info("Starting AgentCore Gateway Tools API...")
+    logger.info("OpenAPI specs bucket: %s", OPENAPI_SPECS_BUCKET)
+    logger.info("AWS Region: %s", AWS_REGION)
+
+    # Multi-worker uvicorn with the C-accelerated event loop and HTTP parser
+    # (both ship with uvicorn[standard]). The app must be passed as an import
+    # string for workers > 1. The endpoints are all AWS-IO bound, so each
+    # async worker handles many in-flight requests and replication across
+    # cores covers the CPU-bound serialization work. limit_concurrency is
+    # matched to the httpx pool size so excess load is shed with a 503
+    # instead of queueing behind exhausted connections.
+    workers = 2 * multiprocessing.cpu_count() + 1
+    logger.info("Starting %d uvicorn worker(s)", workers)
 
     uvicorn.run(
-        app,
+        "api.main:app",
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=100,
+        backlog=2048,
+        log_level="info",
+        access_log=False
     )
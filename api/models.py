@@ -4,7 +4,7 @@ Request/Response models and type definitions for the API
 """
 from datetime import datetime
 from typing import Any, Literal, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AuthConfig(BaseModel):
@@ -24,8 +24,8 @@ class Auth(BaseModel):
 class CognitoAuthConfig(BaseModel):
     """Cognito authentication configuration for gateways"""
     user_pool_id: str
-    client_id: str
-    discovery_url: str
+    client_id: str = Field(min_length=1)
+    discovery_url: str = Field(min_length=1)
 
 
 class HealthCheckResponse(BaseModel):
@@ -38,6 +38,7 @@ class HealthCheckResponse(BaseModel):
 
 class CreateToolResponse(BaseModel):
     """Response after creating a tool - includes all fields from AWS SDK response"""
+    model_config = ConfigDict(frozen=True)
     status: str
     tool_name: str
     gateway_id: str
@@ -86,10 +87,31 @@ class CreateToolFromSpecRequest(BaseModel):
     """Request to create a tool from an inline OpenAPI spec"""
     gateway_id: str
     tool_name: str
-    openapi_spec: dict
+    # Any rather than dict: pydantic passes the parsed spec through by
+    # reference instead of re-walking a potentially multi-MB tree to check
+    # key types. Structure is enforced by validate_openapi_spec downstream.
+    openapi_spec: Any
     auth: Optional[Auth] = None
 
 
+class AsyncCreateToolResponse(BaseModel):
+    """Accepted response for asynchronous tool creation"""
+    status: str
+    operation_id: str
+    tool_name: str
+    gateway_id: str
+    openapi_spec_path: str
+    message: str
+
+
+class OperationStatusResponse(BaseModel):
+    """Status of an asynchronous tool-creation operation"""
+    operation_id: str
+    status: Literal["pending", "success", "error"]
+    result: Optional[CreateToolResponse] = None
+    detail: Optional[str] = None
+
+
 class CreateGatewayRequest(BaseModel):
     """Request to create a gateways"""
     gateway_name: str
@@ -105,6 +127,7 @@ class CreateGatewayNoAuthRequest(BaseModel):
 
 class CreateGatewayResponse(BaseModel):
     """Response after creating a gateway - includes all fields from AWS SDK response"""
+    model_config = ConfigDict(frozen=True)
     status: str
     message: str
     # AWS SDK response fields
@@ -132,14 +155,15 @@ class CreateGatewayResponse(BaseModel):
 class UpdateGatewayRequest(BaseModel):
     """Request payload to update a gateway"""
     name: str
-    protocol_type: str
-    authorizer_type: str
+    protocol_type: Literal["MCP"]
+    authorizer_type: Literal["CUSTOM_JWT", "AWS_IAM", "NONE"]
     role_arn: str
     description: Optional[str] = None
 
 
 class UpdateGatewayResponse(BaseModel):
     """Response after updating a gateway - includes all fields from AWS SDK response"""
+    model_config = ConfigDict(frozen=True)
     status: str
     message: str
     # AWS SDK response fields
@@ -166,6 +190,7 @@ class UpdateGatewayResponse(BaseModel):
 
 class GetGatewayResponse(BaseModel):
     """Response after retrieving a gateway - includes all fields from AWS SDK response"""
+    model_config = ConfigDict(frozen=True)
     status: str
     message: str
     # AWS SDK response fields
@@ -212,6 +237,7 @@ class UpdateToolRequest(BaseModel):
 
 class ListGatewaysResponse(BaseModel):
     """Response after listing gateways"""
+    model_config = ConfigDict(frozen=True)
     status: str
     message: str
     items: list[GatewaySummary]
@@ -220,6 +246,7 @@ class ListGatewaysResponse(BaseModel):
 
 class UpdateToolResponse(BaseModel):
     """Response after updating a tool - includes all fields from AWS SDK response"""
+    model_config = ConfigDict(frozen=True)
     status: str
     tool_name: str
     target_id: str
@@ -239,6 +266,7 @@ class UpdateToolResponse(BaseModel):
 
 class GetGatewayTargetResponse(BaseModel):
     """Response after retrieving a gateway target - includes all fields from AWS SDK response"""
+    model_config = ConfigDict(frozen=True)
     status: str
     message: str
     # AWS SDK response fields
@@ -267,6 +295,7 @@ class TargetSummary(BaseModel):
 
 class ListGatewayTargetsResponse(BaseModel):
     """Response after listing gateway targets"""
+    model_config = ConfigDict(frozen=True)
     status: str
     message: str
     items: list[TargetSummary]
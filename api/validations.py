@@ -2,9 +2,47 @@
 validations.py
 Request validation logic for API endpoints.
 """
+import jsonschema_rs
 from fastapi import HTTPException, status
 from api.models import Auth
 
+# Structural check for inline OpenAPI specs, compiled once at import. This is
+# a top-level subset of the OpenAPI meta-schema (full meta-schema validation
+# is overkill here), but unlike a plain key-presence check it runs in
+# jsonschema-rs's compiled Rust core and rejects non-object documents and
+# non-string version fields.
+_OPENAPI_TOP_LEVEL_VALIDATOR = jsonschema_rs.validator_for({
+    "type": "object",
+    "anyOf": [
+        {"required": ["openapi"], "properties": {"openapi": {"type": "string"}}},
+        {"required": ["swagger"], "properties": {"swagger": {"type": "string"}}}
+    ]
+})
+
+
+# Static validation errors, built once instead of per failing request
+_ERR_API_KEY_REQUIRED = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="api_key is required in auth.config when auth.type is 'api_key'"
+)
+_ERR_PROVIDER_NAME_REQUIRED = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="auth.provider_name is required when auth.type is 'api_key'"
+)
+
+
+def _validate_api_key_auth(auth: Auth) -> None:
+    """Ensure api_key auth carries the key and a provider name."""
+    if not auth.config.api_key:
+        raise _ERR_API_KEY_REQUIRED
+    if not auth.provider_name:
+        raise _ERR_PROVIDER_NAME_REQUIRED
+
+
+# Dispatch table over the closed Literal["oauth", "api_key"] set; auth types
+# without an entry (oauth) need no extra checks beyond the model itself.
+_AUTH_VALIDATORS = {"api_key": _validate_api_key_auth}
+
 
 def validate_auth(auth: Auth = None) -> None:
     """
@@ -19,18 +57,26 @@ def validate_auth(auth: Auth = None) -> None:
     Raises:
         HTTPException: 400 Bad Request if validation fails
     """
-    if not auth or auth.type != "api_key":
-        return
+    if auth:
+        validator = _AUTH_VALIDATORS.get(auth.type)
+        if validator:
+            validator(auth)
 
-    if not auth.config.api_key:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="api_key is required in auth.config when auth.type is 'api_key'"
-        )
 
-    if not auth.provider_name:
+def validate_openapi_spec(spec: dict) -> None:
+    """
+    Validate the top-level structure of an OpenAPI spec dict.
+
+    Args:
+        spec: Parsed OpenAPI spec
+
+    Raises:
+        HTTPException: 400 Bad Request if the spec is not an object with an
+            'openapi' or 'swagger' version field
+    """
+    if not _OPENAPI_TOP_LEVEL_VALIDATOR.is_valid(spec):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="auth.provider_name is required when auth.type is 'api_key'"
+            detail="OpenAPI spec must contain 'openapi' or 'swagger' field"
         )
 
@@ -6,8 +6,9 @@ These resources can be reused across multiple gateways.
 """
 import os
 import json
-import boto3
-from botocore.exceptions import ClientError
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # CONFIG: change these as needed
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
@@ -16,16 +17,46 @@ RESOURCE_SERVER_ID = "sample-agentcore-gateways-id"
 RESOURCE_SERVER_NAME = "sample-agentcore-gateways-name"
 CLIENT_NAME = "sample-agentcore-gateways-client"
 
+# Single source of truth for the OIDC discovery URL shape; setup_auth and
+# get_token both fill this template instead of repeating the f-string.
+_DISCOVERY_URL_FMT = "https://cognito-idp.{region}.amazonaws.com/{pool_id}/.well-known/openid-configuration"
+
+# Shared session/client, created lazily and reused across calls. Session and
+# client construction parse the service model JSON and build endpoint
+# resolvers, which is far too expensive to repeat per invocation. boto3 is
+# imported here rather than at module scope so importing this module stays
+# cheap for callers that only need get_token.
+_session = None
+_cognito_client = None
+
+
+def _get_cognito_client():
+    """Return the shared cognito-idp client, creating it on first use."""
+    global _session, _cognito_client
+    if _cognito_client is None:
+        import boto3
+        from botocore.config import Config
+
+        # Cognito throttles aggressively under concurrent setup runs
+        # (TooManyRequestsException); adaptive retries back off client-side
+        # instead of aborting the whole pipeline mid-run.
+        retry_config = Config(retries={"max_attempts": 10, "mode": "adaptive"})
+        _session = boto3.Session(region_name=AWS_REGION)
+        _cognito_client = _session.client("cognito-idp", config=retry_config)
+    return _cognito_client
+
 
 def get_or_create_user_pool(cognito_client, pool_name):
     """
     Gets or creates a Cognito user pool.
     """
-    # try to find existing
-    pools = cognito_client.list_user_pools(MaxResults=60).get("UserPools", [])
-    for p in pools:
-        if p["Name"] == pool_name:
-            return p["Id"]
+    # try to find existing; paginate so pools past the 60-item page are
+    # found instead of silently recreated
+    paginator = cognito_client.get_paginator("list_user_pools")
+    for page in paginator.paginate(PaginationConfig={"PageSize": 60}):
+        for p in page.get("UserPools", []):
+            if p["Name"] == pool_name:
+                return p["Id"]
 
     resp = cognito_client.create_user_pool(PoolName=pool_name)
     return resp["UserPool"]["Id"]
@@ -35,12 +66,21 @@ def get_or_create_resource_server(cognito_client, user_pool_id, identifier, name
     """
     Gets or creates a Cognito resource server.
     """
-    # list existing servers
+    # list existing servers, following NextToken so servers beyond the
+    # first page are found
     try:
-        existing = cognito_client.list_resource_servers(UserPoolId=user_pool_id).get("ResourceServers", [])
-        for rs in existing:
-            if rs["Identifier"] == identifier:
-                return rs
+        next_token = None
+        while True:
+            kwargs = {"UserPoolId": user_pool_id, "MaxResults": 50}
+            if next_token:
+                kwargs["NextToken"] = next_token
+            resp = cognito_client.list_resource_servers(**kwargs)
+            for rs in resp.get("ResourceServers", []):
+                if rs["Identifier"] == identifier:
+                    return rs
+            next_token = resp.get("NextToken")
+            if not next_token:
+                break
     except Exception:
         pass
 
@@ -53,18 +93,25 @@ def get_or_create_resource_server(cognito_client, user_pool_id, identifier, name
     return resp
 
 
-def get_or_create_m2m_client(cognito_client, user_pool_id, client_name, resource_server_id):
+def _find_m2m_client(cognito_client, user_pool_id, client_name):
     """
-    Creates or returns an existing confidential client configured for client credentials.
+    Return (client_id, client_secret) for an existing client, or None.
     """
-    clients = cognito_client.list_user_pool_clients(UserPoolId=user_pool_id, MaxResults=60).get("UserPoolClients", [])
-    for c in clients:
-        if c["ClientName"] == client_name:
-            client_id = c["ClientId"]
-            # retrieving secret requires describe
-            desc = cognito_client.describe_user_pool_client(UserPoolId=user_pool_id, ClientId=client_id)
-            return client_id, desc["UserPoolClient"].get("ClientSecret")
+    paginator = cognito_client.get_paginator("list_user_pool_clients")
+    for page in paginator.paginate(UserPoolId=user_pool_id, PaginationConfig={"PageSize": 60}):
+        for c in page.get("UserPoolClients", []):
+            if c["ClientName"] == client_name:
+                client_id = c["ClientId"]
+                # retrieving secret requires describe
+                desc = cognito_client.describe_user_pool_client(UserPoolId=user_pool_id, ClientId=client_id)
+                return client_id, desc["UserPoolClient"].get("ClientSecret")
+    return None
 
+
+def _create_m2m_client(cognito_client, user_pool_id, client_name, resource_server_id):
+    """
+    Create a confidential client configured for client credentials.
+    """
     resp = cognito_client.create_user_pool_client(
         UserPoolId=user_pool_id,
         ClientName=client_name,
@@ -78,20 +125,75 @@ def get_or_create_m2m_client(cognito_client, user_pool_id, client_name, resource
     return client_id, client_secret
 
 
-def get_token(user_pool_id, client_id, client_secret, scope, region):
+def get_or_create_m2m_client(cognito_client, user_pool_id, client_name, resource_server_id):
+    """
+    Creates or returns an existing confidential client configured for client credentials.
+    """
+    existing = _find_m2m_client(cognito_client, user_pool_id, client_name)
+    if existing:
+        return existing
+    return _create_m2m_client(cognito_client, user_pool_id, client_name, resource_server_id)
+
+
+# Shared keep-alive HTTP session: the discovery fetch and the token POST hit
+# the same Cognito host, so reusing one pooled session avoids a fresh TLS
+# handshake per request. Created lazily to keep the requests import off the
+# module import path.
+_http_session = None
+
+# Generous connect/read timeouts so a wedged endpoint cannot hang setup forever
+_HTTP_TIMEOUT = (3, 10)
+
+
+def _get_http_session():
+    """Return the shared keep-alive HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _http_session = requests.Session()
+        _http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return _http_session
+
+
+# OIDC discovery documents keyed by discovery URL. The document is effectively
+# static per user pool, so refetching it before every token call just adds a
+# network round-trip; an hour-long TTL picks up the rare rotation.
+_DISCOVERY_TTL = 3600.0
+_discovery_cache = {}
+_discovery_lock = threading.Lock()
+
+
+def _get_discovery(url):
+    """
+    Fetch (and cache) the OIDC discovery document behind a discovery URL.
+    """
+    entry = _discovery_cache.get(url)
+    if entry and time.monotonic() - entry[0] < _DISCOVERY_TTL:
+        return entry[1]
+
+    disc = _get_http_session().get(url, timeout=_HTTP_TIMEOUT).json()
+    with _discovery_lock:
+        _discovery_cache[url] = (time.monotonic(), disc)
+    return disc
+
+
+def get_token(user_pool_id, client_id, client_secret, scope, region, discovery_url=None):
     """
     Performs client_credentials flow against Cognito token endpoint.
     scope: space-separated string of scopes
+    discovery_url: optional pre-built discovery URL (e.g. from a cached
+        auth_config); when omitted it is derived from region and pool id.
     Returns token json.
     """
-    import requests
-    discovery = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/openid-configuration"
-    disc = requests.get(discovery).json()
+    if discovery_url is None:
+        discovery_url = _DISCOVERY_URL_FMT.format(region=region, pool_id=user_pool_id)
+    disc = _get_discovery(discovery_url)
     token_url = disc["token_endpoint"]
 
     auth = (client_id, client_secret)
     data = {"grant_type": "client_credentials", "scope": scope}
-    r = requests.post(token_url, auth=auth, data=data)
+    r = _get_http_session().post(token_url, auth=auth, data=data, timeout=_HTTP_TIMEOUT)
     r.raise_for_status()
     return r.json()
 
@@ -103,29 +205,38 @@ def setup_auth():
 
     Returns: dict with auth configuration needed for gateways setup
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    cognito = session.client("cognito-idp")
+    cognito = _get_cognito_client()
 
     # 1) Create/retrieve Cognito user pool
     print("Creating/retrieving Cognito user pool...")
     user_pool_id = get_or_create_user_pool(cognito, COGNITO_USER_POOL_NAME)
     print(f"User pool id: {user_pool_id}")
 
-    # 2) Create/retrieve resource server with scopes
-    print("Creating/retrieving resource server...")
+    # 2+3) Create/retrieve resource server and M2M client. The client probe is
+    # independent of the resource server, so both run concurrently (boto3
+    # clients are thread-safe); only a missing client has to wait for the
+    # resource server, since its creation references the server's scopes.
+    print("Creating/retrieving resource server and M2M client...")
     scopes = [
         {"ScopeName": "gateways:read", "ScopeDescription": "Read access"},
         {"ScopeName": "gateways:write", "ScopeDescription": "Write access"}
     ]
-    get_or_create_resource_server(cognito, user_pool_id, RESOURCE_SERVER_ID, RESOURCE_SERVER_NAME, scopes)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        server_future = pool.submit(
+            get_or_create_resource_server, cognito, user_pool_id, RESOURCE_SERVER_ID, RESOURCE_SERVER_NAME, scopes
+        )
+        client_future = pool.submit(_find_m2m_client, cognito, user_pool_id, CLIENT_NAME)
+        server_future.result()
+        existing_client = client_future.result()
 
-    # 3) Create/retrieve M2M client
-    print("Creating/retrieving M2M client...")
-    client_id, client_secret = get_or_create_m2m_client(cognito, user_pool_id, CLIENT_NAME, RESOURCE_SERVER_ID)
+    if existing_client:
+        client_id, client_secret = existing_client
+    else:
+        client_id, client_secret = _create_m2m_client(cognito, user_pool_id, CLIENT_NAME, RESOURCE_SERVER_ID)
     print(f"Client ID: {client_id}")
 
     # 4) Build discovery URL
-    discovery_url = f"https://cognito-idp.{AWS_REGION}.amazonaws.com/{user_pool_id}/.well-known/openid-configuration"
+    discovery_url = _DISCOVERY_URL_FMT.format(region=AWS_REGION, pool_id=user_pool_id)
     print(f"Cognito discovery URL: {discovery_url}")
 
     auth_config = {
@@ -4,10 +4,38 @@ API key credential provider management.
 """
 import os
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
 
+# Connection tuning for the chatty control-plane client: a larger keep-alive
+# pool amortizes TLS handshakes across concurrent calls, adaptive retries
+# back off under throttling, and TCP keepalive stops idle connections from
+# being dropped between bursts.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# Shared session/client, created lazily and reused across calls. boto3 clients
+# are thread-safe, and rebuilding one per call re-reads config, re-resolves
+# endpoints, and opens a fresh HTTPS connection to AWS.
+_session = None
+_agentcore_client = None
+
+
+def _get_agentcore_client():
+    """Return the shared bedrock-agentcore-control client, creating it on first use."""
+    global _session, _agentcore_client
+    if _agentcore_client is None:
+        _session = boto3.Session(region_name=AWS_REGION)
+        _agentcore_client = _session.client("bedrock-agentcore-control", config=_CLIENT_CONFIG)
+    return _agentcore_client
+
 
 def create_or_get_api_key_credential_provider(provider_name: str, api_key: str) -> str:
     """
@@ -24,8 +52,7 @@ def create_or_get_api_key_credential_provider(provider_name: str, api_key: str)
         ValueError: If credential provider with same name already exists
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    agentcore = session.client("bedrock-agentcore-control")
+    agentcore = _get_agentcore_client()
 
     print(f"Creating/retrieving credential provider: {provider_name}")
     try:
@@ -36,7 +63,13 @@ def create_or_get_api_key_credential_provider(provider_name: str, api_key: str)
         credential_provider_arn = resp["credentialProviderArn"]
         print("✓ Credential provider created.")
     except ClientError as e:
-        if "already exists" in str(e) or "EntityAlreadyExists" in str(e):
+        # create_api_key_credential_provider signals a duplicate name with
+        # ConflictException; ValidationException covers older API revisions
+        # that rejected the duplicate at validation time. Matching on the
+        # error code is robust across boto3 versions, unlike substring
+        # checks against the rendered exception message.
+        code = e.response.get("Error", {}).get("Code", "")
+        if code in ("ConflictException", "ResourceConflictException", "ValidationException"):
             print("✓ Credential provider already exists.")
             raise ValueError(
                 f"Credential provider '{provider_name}' already exists. "
@@ -48,3 +81,38 @@ def create_or_get_api_key_credential_provider(provider_name: str, api_key: str)
     print(f"Credential provider ARN: {credential_provider_arn}")
     return credential_provider_arn
 
+
+def get_or_create_api_key_credential_provider(provider_name: str, api_key: str) -> str:
+    """
+    Idempotently resolve an API key credential provider's ARN.
+
+    Unlike create_or_get_api_key_credential_provider, an existing provider is
+    not an error: its ARN is fetched and returned, so shared providers (e.g.
+    the placeholder used for public APIs) can be resolved repeatedly without
+    a unique name per caller.
+
+    Args:
+        provider_name: Name of the credential provider
+        api_key: The API key value used if the provider must be created
+
+    Returns:
+        Credential provider ARN
+
+    Raises:
+        ClientError: If AWS API call fails
+    """
+    agentcore = _get_agentcore_client()
+
+    try:
+        resp = agentcore.create_api_key_credential_provider(
+            name=provider_name,
+            apiKey=api_key
+        )
+        return resp["credentialProviderArn"]
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code", "")
+        if code not in ("ConflictException", "ResourceConflictException", "ValidationException"):
+            raise
+        resp = agentcore.get_api_key_credential_provider(name=provider_name)
+        return resp["credentialProviderArn"]
+
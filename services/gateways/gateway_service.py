@@ -4,14 +4,54 @@ Gateway creation, deletion, and management.
 """
 import os
 import json
+import logging
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
 ROLE_NAME = "sample-lambdagateway-role-demo"
 
-
-def get_gateway(gateway_id: str) -> dict:
+# Connection tuning for the chatty control-plane client: a larger keep-alive
+# pool amortizes TLS handshakes across concurrent calls, adaptive retries
+# back off under throttling, and TCP keepalive stops idle connections from
+# being dropped between bursts.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# Shared session/client, created lazily and reused across calls. boto3 clients
+# are thread-safe, and rebuilding one per call re-reads config, re-resolves
+# endpoints, and opens a fresh HTTPS connection to AWS.
+_session = None
+_gateway_client = None
+_iam_client = None
+
+
+def _get_gateway_client():
+    """Return the shared bedrock-agentcore-control client, creating it on first use."""
+    global _session, _gateway_client
+    if _gateway_client is None:
+        _session = boto3.Session(region_name=AWS_REGION)
+        _gateway_client = _session.client("bedrock-agentcore-control", config=_CLIENT_CONFIG)
+    return _gateway_client
+
+
+def _get_iam_client(region: str = None):
+    """Return the shared IAM client, creating it on first use."""
+    global _iam_client
+    if _iam_client is None:
+        _iam_client = boto3.client("iam", region_name=region, config=_CLIENT_CONFIG)
+    return _iam_client
+
+
+def get_gateway(gateway_id: str, client=None) -> dict:
     """
     Retrieve information about a specific gateway.
 
@@ -19,6 +59,7 @@ def get_gateway(gateway_id: str) -> dict:
 
     Args:
         gateway_id: The unique identifier of the gateway to retrieve
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Gateway details containing all gateway properties
@@ -27,15 +68,14 @@ def get_gateway(gateway_id: str) -> dict:
         ValueError: If gateway not found
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
-    print(f"Retrieving gateway: {gateway_id}...")
+    logger.info("Retrieving gateway: %s...", gateway_id)
 
     try:
         # The API expects 'gatewayIdentifier' (not 'gatewayId')
         response = gateway_client.get_gateway(gatewayIdentifier=gateway_id)
-        print(f"✓ Gateway retrieved. Name: {response.get('name')}")
+        logger.info("Gateway retrieved. Name: %s", response.get("name"))
         return response
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
@@ -45,7 +85,7 @@ def get_gateway(gateway_id: str) -> dict:
             raise
 
 
-def list_gateways(max_results: int = None, next_token: str = None) -> dict:
+def list_gateways(max_results: int = None, next_token: str = None, client=None) -> dict:
     """
     List all gateways in the account.
 
@@ -54,6 +94,7 @@ def list_gateways(max_results: int = None, next_token: str = None) -> dict:
     Args:
         max_results: Maximum number of results to return (1-1000). If not provided, uses AWS default.
         next_token: Token for pagination to get the next batch of results
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Contains:
@@ -65,10 +106,9 @@ def list_gateways(max_results: int = None, next_token: str = None) -> dict:
     Raises:
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
-    print("Listing all gateways...")
+    logger.info("Listing all gateways...")
 
     list_params = {}
     if max_results is not None:
@@ -82,15 +122,15 @@ def list_gateways(max_results: int = None, next_token: str = None) -> dict:
     try:
         response = gateway_client.list_gateways(**list_params)
         items = response.get("items", [])
-        print(f"✓ Retrieved {len(items)} gateway(s).")
+        logger.info("Retrieved %d gateway(s).", len(items))
         if response.get("nextToken"):
-            print(f"  More results available. Use nextToken to fetch more.")
+            logger.info("More results available. Use nextToken to fetch more.")
         return response
     except ClientError as e:
         raise
 
 
-def create_gateway(gateway_name: str, role_arn: str, is_authenticated: bool, auth_config: dict = None, description: str = None) -> dict:
+def create_gateway(gateway_name: str, role_arn: str, is_authenticated: bool, auth_config: dict = None, description: str = None, client=None) -> dict:
     """
     Create a gateways.
 
@@ -100,6 +140,7 @@ def create_gateway(gateway_name: str, role_arn: str, is_authenticated: bool, aut
         is_authenticated: If True, creates gateways with JWT auth; if False, no auth
         auth_config: Required if is_authenticated=True; dict with client_id and discovery_url
         description: Optional gateways description
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict with gateway_id, gateway_url, and gateway_name
@@ -108,27 +149,32 @@ def create_gateway(gateway_name: str, role_arn: str, is_authenticated: bool, aut
         ValueError: If validation fails
         ClientError: If AWS API call fails
     """
-    print(f"Creating gateways: {gateway_name}...")
+    # Validate before the AWS round-trip: a bad call should fail in
+    # microseconds instead of burning a control-plane request.
+    if is_authenticated and not (auth_config and auth_config.get("client_id") and auth_config.get("discovery_url")):
+        raise ValueError("auth_config with client_id and discovery_url is required when is_authenticated=True")
+
+    logger.info("Creating gateways: %s...", gateway_name)
 
     try:
         if is_authenticated:
-            create_response = _create_gateway_with_auth(gateway_name, role_arn, auth_config, description)
-            print("✓ Gateway created with JWT auth.")
+            create_response = _create_gateway_with_auth(gateway_name, role_arn, auth_config, description, client)
+            logger.info("Gateway created with JWT auth.")
         else:
-            create_response = _create_gateway_without_auth(gateway_name, role_arn, description)
-            print("✓ Gateway created without auth.")
+            create_response = _create_gateway_without_auth(gateway_name, role_arn, description, client)
+            logger.info("Gateway created without auth.")
     except ClientError as e:
         raise
 
 
-    print("Gateway info:")
-    for k, v in create_response.items():
-        print(f"  {k}: {v}")
+    # Full response dump only when debug logging is on; formatting the nested
+    # dict per call is pure overhead for programmatic callers like the API.
+    logger.debug("gateway response: %s", create_response)
 
     gateway_id = create_response.get("gatewayId")
     gateway_url = create_response.get("gatewayUrl")
-    print(f"Gateway ID: {gateway_id}")
-    print(f"Gateway URL: {gateway_url}")
+    logger.info("Gateway ID: %s", gateway_id)
+    logger.info("Gateway URL: %s", gateway_url)
 
     if not gateway_id or not gateway_url:
         raise ValueError(f"Invalid gateway response: {create_response}")
@@ -143,7 +189,8 @@ def update_gateway(
     authorizer_type: str,
     role_arn: str,
     description: str = None,
-    authorizer_configuration: dict = None
+    authorizer_configuration: dict = None,
+    client=None
 ) -> dict:
     """
     Update an existing gateway.
@@ -158,6 +205,7 @@ def update_gateway(
         role_arn: The IAM role ARN for the gateway
         description: Optional updated description
         authorizer_configuration: Optional updated authorizer configuration
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Update response containing:
@@ -178,10 +226,9 @@ def update_gateway(
         ValueError: If gateway not found
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
-    print(f"Updating gateway: {gateway_id}...")
+    logger.info("Updating gateway: %s...", gateway_id)
 
     # Build update parameters
     update_params = {
@@ -201,17 +248,8 @@ def update_gateway(
 
     try:
         response = gateway_client.update_gateway(**update_params)
-        print("✓ Gateway updated.")
-
-        # Log key response details
-        print(f"  Gateway ID: {response.get('gatewayId')}")
-        print(f"  Gateway URL: {response.get('gatewayUrl')}")
-        print(f"  Status: {response.get('status')}")
-        print(f"  Name: {response.get('name')}")
-        if response.get('updatedAt'):
-            print(f"  Updated At: {response.get('updatedAt')}")
-        if response.get('statusReasons'):
-            print(f"  Status Reasons: {response.get('statusReasons')}")
+        logger.info("Gateway updated.")
+        logger.debug("gateway update response: %s", response)
 
         return response
     except ClientError as e:
@@ -222,30 +260,82 @@ def update_gateway(
             raise
 
 
-def delete_gateway(gateway_id: str) -> None:
+def delete_gateway(gateway_id: str, client=None) -> None:
     """
     Delete a gateways by ID.
 
     Args:
         gateway_id: The ID of the gateways to delete
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Raises:
         Exception: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
     try:
-        print(f"Deleting gateways {gateway_id}...")
+        logger.info("Deleting gateways %s...", gateway_id)
         # The API expects 'gatewayIdentifier' (not 'gatewayId')
         gateway_client.delete_gateway(gatewayIdentifier=gateway_id)
-        print("✓ Gateway deleted.")
+        logger.info("Gateway deleted.")
     except Exception as e:
-        print(f"delete gateways error: {e}")
+        logger.warning("delete gateways error: %s", e)
         raise
 
 # Private methods
-def create_agentcore_gateway_role(role_name: str, region: str = None) -> str:
+# Invariant IAM policy documents, serialized once at import instead of being
+# rebuilt and re-dumped on every role creation call.
+_ASSUME_ROLE_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {"Service": "bedrock-agentcore.amazonaws.com"},
+            "Action": "sts:AssumeRole"
+        }
+    ]
+}
+_GATEWAY_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "bedrock-agentcore-control:*",
+                "s3:GetObject",
+                "s3:PutObject",
+                "s3:ListBucket",
+                "iam:PassRole",
+                "cognito-idp:*",
+                "sts:GetCallerIdentity"
+            ],
+            "Resource": "*"
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "bedrock-agentcore:GetWorkloadAccessToken",
+                "bedrock-agentcore:InvokeCredentialProvider",
+                "bedrock-agentcore:GetResourceApiKey"
+            ],
+            "Resource": "*"
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "secretsmanager:GetSecretValue"
+            ],
+            "Resource": "*"
+        }
+    ]
+}
+_ASSUME_ROLE_POLICY_JSON = json.dumps(_ASSUME_ROLE_POLICY)
+_GATEWAY_POLICY_JSON = json.dumps(_GATEWAY_POLICY)
+# Canonical form used to detect an already up-to-date inline policy
+_GATEWAY_POLICY_NORMALIZED = json.dumps(_GATEWAY_POLICY, sort_keys=True)
+
+
+def create_agentcore_gateway_role(role_name: str, region: str = None, client=None) -> str:
     """
     Create an IAM role for the AgentCore Gateway.
 
@@ -255,88 +345,71 @@ def create_agentcore_gateway_role(role_name: str, region: str = None) -> str:
     Args:
         role_name: Name of the IAM role to create
         region: Optional AWS region
+        client: Optional pre-built IAM client; defaults to the shared module client
 
     Returns:
         Role ARN string
     """
-    iam = boto3.client("iam", region_name=region)
-    assume_role_policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Principal": {"Service": "bedrock-agentcore.amazonaws.com"},
-                "Action": "sts:AssumeRole"
-            }
-        ]
-    }
+    iam = client or _get_iam_client(region)
 
+    # Probe with get_role first: in the steady state the role already exists,
+    # and the read-path call is cheaper and far less rate-limited than a
+    # speculative create_role that is expected to fail with
+    # EntityAlreadyExists.
+    role_existed = True
     try:
-        resp = iam.create_role(
-            RoleName=role_name,
-            AssumeRolePolicyDocument=json.dumps(assume_role_policy),
-            Description="Role for Bedrock AgentCore Gateway"
-        )
+        resp = iam.get_role(RoleName=role_name)
         role_arn = resp["Role"]["Arn"]
     except ClientError as e:
-        if e.response['Error']['Code'] == 'EntityAlreadyExists':
-            resp = iam.get_role(RoleName=role_name)
-            role_arn = resp['Role']['Arn']
-        else:
+        if e.response["Error"]["Code"] != "NoSuchEntity":
             raise
+        role_existed = False
+        try:
+            resp = iam.create_role(
+                RoleName=role_name,
+                AssumeRolePolicyDocument=_ASSUME_ROLE_POLICY_JSON,
+                Description="Role for Bedrock AgentCore Gateway"
+            )
+            role_arn = resp["Role"]["Arn"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "EntityAlreadyExists":
+                # Lost a creation race with a concurrent worker
+                role_existed = True
+                resp = iam.get_role(RoleName=role_name)
+                role_arn = resp["Role"]["Arn"]
+            else:
+                raise
+
+    # For a pre-existing role, skip the IAM write when the inline policy is
+    # already identical — put_role_policy counts against IAM throttling even
+    # when it changes nothing.
+    if role_existed:
+        try:
+            existing = iam.get_role_policy(
+                RoleName=role_name,
+                PolicyName=f"{role_name}-inline-policy"
+            )
+            if json.dumps(existing.get("PolicyDocument"), sort_keys=True) == _GATEWAY_POLICY_NORMALIZED:
+                return role_arn
+        except ClientError:
+            pass
 
     # Attach inline policy for gateways management
-    policy_document = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "bedrock-agentcore-control:*",
-                    "s3:GetObject",
-                    "s3:PutObject",
-                    "s3:ListBucket",
-                    "iam:PassRole",
-                    "cognito-idp:*",
-                    "sts:GetCallerIdentity"
-                ],
-                "Resource": "*"
-            },
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "bedrock-agentcore:GetWorkloadAccessToken",
-                    "bedrock-agentcore:InvokeCredentialProvider",
-                    "bedrock-agentcore:GetResourceApiKey"
-                ],
-                "Resource": "*"
-            },
-            {
-                "Effect": "Allow",
-                "Action": [
-                    "secretsmanager:GetSecretValue"
-                ],
-                "Resource": "*"
-            }
-        ]
-    }
-
     try:
         iam.put_role_policy(
             RoleName=role_name,
             PolicyName=f"{role_name}-inline-policy",
-            PolicyDocument=json.dumps(policy_document)
+            PolicyDocument=_GATEWAY_POLICY_JSON
         )
     except Exception as e:
-        print("Warning attaching inline policy:", e)
+        logger.warning("Warning attaching inline policy: %s", e)
 
     return role_arn
 
 
-def _create_gateway_with_auth(gateway_name: str, role_arn: str, auth_config: dict, description: str) -> dict:
+def _create_gateway_with_auth(gateway_name: str, role_arn: str, auth_config: dict, description: str, client=None) -> dict:
     """Create a gateways with JWT authentication."""
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
     jwt_auth_config = {
         "customJWTAuthorizer": {
@@ -355,10 +428,9 @@ def _create_gateway_with_auth(gateway_name: str, role_arn: str, auth_config: dic
     )
 
 
-def _create_gateway_without_auth(gateway_name: str, role_arn: str, description: str) -> dict:
+def _create_gateway_without_auth(gateway_name: str, role_arn: str, description: str, client=None) -> dict:
     """Create a gateways without authentication."""
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
     return gateway_client.create_gateway(
         name=gateway_name,
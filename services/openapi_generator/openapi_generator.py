@@ -2,14 +2,30 @@
 openapi_generator.py
 Generates OpenAPI 3.0 spec from minimal API information.
 """
+import copy
+import re
+from functools import lru_cache
+from itertools import chain
 from typing import Optional
 from urllib.parse import urlparse
 
+import orjson
 
+
+# Uppercases the character after each -/_ separator; the regex engine walks
+# the string in C instead of a Python-level split/capitalize/join pass.
+_CAMEL_RE = re.compile(r"[-_]+(.)")
+
+
+@lru_cache(maxsize=4096)
 def _to_camel_case(s: str) -> str:
     """Convert string to camelCase."""
-    parts = s.replace("-", "_").split("_")
-    return parts[0].lower() + "".join(word.capitalize() for word in parts[1:])
+    return _CAMEL_RE.sub(lambda m: m.group(1).upper(), s.lower().rstrip("-_"))
+
+
+# Scheme, authority, and path — the only pieces of the URL the spec needs;
+# the compiled regex skips urlparse's full six-component split per call.
+_URL_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.-]*)://([^/?#]*)(/[^?#]*)?")
 
 
 def _extract_path_from_url(url: str) -> tuple[str, str]:
@@ -19,44 +35,40 @@ def _extract_path_from_url(url: str) -> tuple[str, str]:
     Returns:
         Tuple of (base_url, path)
     """
-    parsed = urlparse(url)
-    base_url = f"{parsed.scheme}://{parsed.netloc}"
-    path = parsed.path or "/"
-    return base_url, path
+    m = _URL_RE.match(url)
+    if not m:
+        # No scheme — mirror urlparse, which treats the input as a bare path
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}", parsed.path or "/"
+    return f"{m.group(1)}://{m.group(2)}", m.group(3) or "/"
 
 
-def _json_schema_to_parameters(schema: dict, location: str) -> list[dict]:
+def _iter_params(schema: Optional[dict], location: str):
     """
-    Convert JSON Schema object to OpenAPI parameters list.
+    Yield OpenAPI parameter objects for a JSON Schema's properties.
+
+    A generator so the query and header schemas can feed one output list
+    without building an intermediate list per schema.
 
     Args:
-        schema: JSON Schema with properties
+        schema: JSON Schema with properties, or None
         location: 'query' or 'header'
-
-    Returns:
-        List of OpenAPI parameter objects
     """
-    parameters = []
-    properties = schema.get("properties", {})
-    required_fields = schema.get("required", [])
-
-    for name, prop in properties.items():
-        param = {
+    if not schema:
+        return
+    # Set membership is O(1) per field vs scanning the required list
+    required = set(schema.get("required", ()))
+    for name, prop in schema.get("properties", {}).items():
+        yield {
             "name": name,
             "in": location,
-            "required": name in required_fields,
+            "required": name in required,
             "schema": {
-                "type": prop.get("type", "string")
-            }
+                "type": prop.get("type", "string"),
+                **({"enum": prop["enum"]} if "enum" in prop else {})
+            },
+            **({"description": prop["description"]} if "description" in prop else {})
         }
-        if "description" in prop:
-            param["description"] = prop["description"]
-        if "enum" in prop:
-            param["schema"]["enum"] = prop["enum"]
-
-        parameters.append(param)
-
-    return parameters
 
 
 def generate_openapi_spec(
@@ -71,6 +83,11 @@ def generate_openapi_spec(
     """
     Generate an OpenAPI 3.0 spec from minimal API information.
 
+    Pure data transformation, so results are memoized: bulk registration
+    often repeats the same (method, url, schema) shapes across tools, and a
+    cache hit skips rebuilding the nested spec dicts entirely. The schema
+    dicts are keyed by their sorted JSON form to make them hashable.
+
     Args:
         tool_name: Name of the tool (used for title and operation ID)
         method: HTTP method (GET, POST, PUT, DELETE, etc.)
@@ -83,6 +100,34 @@ def generate_openapi_spec(
     Returns:
         Valid OpenAPI 3.0 spec as dict
     """
+    spec = _generate_cached(
+        tool_name,
+        method,
+        url,
+        orjson.dumps(query_params, option=orjson.OPT_SORT_KEYS) if query_params else None,
+        orjson.dumps(headers, option=orjson.OPT_SORT_KEYS) if headers else None,
+        orjson.dumps(body_schema, option=orjson.OPT_SORT_KEYS) if body_schema else None,
+        description
+    )
+    # Deep copy so callers can mutate their spec without poisoning the cache
+    return copy.deepcopy(spec)
+
+
+@lru_cache(maxsize=1024)
+def _generate_cached(
+    tool_name: str,
+    method: str,
+    url: str,
+    query_params_json: Optional[bytes],
+    headers_json: Optional[bytes],
+    body_schema_json: Optional[bytes],
+    description: Optional[str]
+) -> dict:
+    """Build the spec from hashable inputs; see generate_openapi_spec."""
+    query_params = orjson.loads(query_params_json) if query_params_json else None
+    headers = orjson.loads(headers_json) if headers_json else None
+    body_schema = orjson.loads(body_schema_json) if body_schema_json else None
+
     base_url, path = _extract_path_from_url(url)
     method_lower = method.lower()
 
@@ -90,12 +135,8 @@ def generate_openapi_spec(
     path_part = path.strip("/").replace("/", "_")
     operation_id = f"{tool_name}__{_to_camel_case(path_part)}" if path_part else f"{tool_name}__root"
 
-    # Build parameters list
-    parameters = []
-    if query_params:
-        parameters.extend(_json_schema_to_parameters(query_params, "query"))
-    if headers:
-        parameters.extend(_json_schema_to_parameters(headers, "header"))
+    # Build parameters list in one pass over both schemas
+    parameters = list(chain(_iter_params(query_params, "query"), _iter_params(headers, "header")))
 
     # Build operation object
     operation = {
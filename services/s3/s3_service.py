@@ -2,35 +2,109 @@
 s3_service.py
 S3 operations for storing and retrieving OpenAPI specs.
 """
+import hashlib
 import os
-import json
+import logging
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
 
+# Specs above this size are uploaded as parallel multipart chunks
+_SPEC_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024)
+
+# Connection tuning shared by the S3/STS clients: a larger keep-alive pool
+# amortizes TLS handshakes across concurrent uploads, adaptive retries back
+# off under throttling, and TCP keepalive stops idle connections from being
+# dropped between bursts. Read timeout is generous for multi-MB spec bodies.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=60
+)
+
+# Shared session/clients, created lazily and reused across calls. boto3 clients
+# are thread-safe, and rebuilding one per call re-reads config, re-resolves
+# endpoints, and opens a fresh HTTPS connection to AWS.
+_session = None
+_s3_client = None
+_sts_client = None
+
+
+def _get_s3_client():
+    """Return the shared S3 client, creating it on first use."""
+    global _session, _s3_client
+    if _s3_client is None:
+        if _session is None:
+            _session = boto3.Session(region_name=AWS_REGION)
+        _s3_client = _session.client("s3", config=_CLIENT_CONFIG)
+    return _s3_client
+
+
+def _get_sts_client():
+    """Return the shared STS client, creating it on first use."""
+    global _session, _sts_client
+    if _sts_client is None:
+        if _session is None:
+            _session = boto3.Session(region_name=AWS_REGION)
+        _sts_client = _session.client("sts", config=_CLIENT_CONFIG)
+    return _sts_client
 
-def _ensure_s3_bucket(bucket_name: str = None) -> str:
+
+# Bucket-existence results cached per process: the default bucket name needs
+# an STS round-trip to resolve, and verifying the bucket needs another S3
+# call — both are invariants, yet were paid on every single upload.
+_default_bucket_name = None
+_verified_buckets = set()
+
+
+def _ensure_s3_bucket(bucket_name: str = None, s3_client=None) -> str:
     """
     Ensure an S3 bucket exists and return its name.
 
+    Buckets verified once in this process are trusted thereafter, so repeat
+    uploads skip the STS and S3 round-trips entirely.
+
     Args:
         bucket_name: Optional explicit bucket name. If not provided, generates a default per-account name.
 
     Returns:
         The bucket name (either provided or generated)
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    s3 = session.client("s3")
-    sts = session.client("sts")
+    global _default_bucket_name
+    s3 = s3_client or _get_s3_client()
 
     if not bucket_name:
-        account_id = sts.get_caller_identity()["Account"]
-        bucket_name = f"agentcore-gateways-targets-openapi-specs-{account_id}-{AWS_REGION}"
+        if _default_bucket_name is None:
+            account_id = _get_sts_client().get_caller_identity()["Account"]
+            _default_bucket_name = f"agentcore-gateways-targets-openapi-specs-{account_id}-{AWS_REGION}"
+        bucket_name = _default_bucket_name
+
+    if bucket_name in _verified_buckets:
+        return bucket_name
+
+    logger.info("Ensuring S3 bucket exists: %s", bucket_name)
+    # Probe with head_bucket first: a cheap read that confirms the common
+    # case (bucket already exists) without hitting the heavily rate-limited
+    # create_bucket write path. Only a 404 falls through to creation.
+    try:
+        s3.head_bucket(Bucket=bucket_name)
+        logger.info("S3 bucket already exists.")
+        _verified_buckets.add(bucket_name)
+        return bucket_name
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("404", "NoSuchBucket"):
+            raise
 
-    print(f"Ensuring S3 bucket exists: {bucket_name}")
     try:
         if AWS_REGION == "us-east-1":
             s3.create_bucket(Bucket=bucket_name)
@@ -39,47 +113,152 @@ def _ensure_s3_bucket(bucket_name: str = None) -> str:
                 Bucket=bucket_name,
                 CreateBucketConfiguration={"LocationConstraint": AWS_REGION}
             )
-        print("✓ Created S3 bucket.")
+        logger.info("Created S3 bucket.")
     except ClientError as e:
         if e.response["Error"]["Code"] in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
-            print("✓ S3 bucket already exists.")
+            logger.info("S3 bucket already exists.")
         else:
             raise
 
+    _verified_buckets.add(bucket_name)
     return bucket_name
 
 
-def upload_openapi_spec(spec_json: dict, tool_name: str, gateway_id: str, bucket_name: str = None) -> str:
+# URIs of specs already uploaded this process, keyed by destination and
+# content hash. Re-registering an unchanged tool re-uploads byte-identical
+# JSON to a fresh timestamped key; reusing the previous object skips the
+# whole PUT. Cleared wholesale at the cap rather than tracking LRU order.
+_SPEC_URI_CACHE_MAX = 1024
+_spec_uri_cache = {}
+
+
+def upload_openapi_spec(spec_json: dict | bytes, tool_name: str, gateway_id: str, bucket_name: str = None, s3_client=None) -> str:
     """
-    Upload an OpenAPI spec provided as a Python dict (in-memory) to S3 and return an s3:// URI.
+    Upload an OpenAPI spec (in-memory) to S3 and return an s3:// URI.
+
+    Accepts either a Python dict or already-serialized JSON bytes. Callers that
+    read the spec off the wire can pass the raw bytes through unchanged, which
+    skips a redundant serialize pass for large specs. A byte-identical spec
+    re-uploaded for the same tool in the same process returns the previously
+    uploaded object's URI without touching S3.
 
     Args:
-        spec_json: OpenAPI spec as a Python dict
+        spec_json: OpenAPI spec as a Python dict or raw JSON bytes
         tool_name: Logical name of the tool
         gateway_id: ID of the gateways this tool is being registered with
         bucket_name: Optional S3 bucket name; if omitted a default per-account bucket is used
+        s3_client: Optional pre-built S3 client; defaults to the shared module client
 
     Returns:
         s3://bucket/key string
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    s3 = session.client("s3")
+    s3 = s3_client or _get_s3_client()
+
+    bucket_name = _ensure_s3_bucket(bucket_name, s3)
 
-    bucket_name = _ensure_s3_bucket(bucket_name)
+    body = spec_json if isinstance(spec_json, bytes) else orjson.dumps(spec_json)
+    cache_key = (bucket_name, gateway_id, tool_name, hashlib.sha256(body).digest())
+    cached_uri = _spec_uri_cache.get(cache_key)
+    if cached_uri:
+        logger.info("OpenAPI spec unchanged; reusing %s", cached_uri)
+        return cached_uri
 
-    # Build hierarchical object key: gateways/{gateway_id}/tools/{tool_name}/{timestamp}-{uuid}.json
+    # Build hierarchical object key: gateways/{gateway_id}/tools/{tool_name}/{timestamp}-{nonce}.json
     # This allows:
     # - Easy listing of all tools for a gateways: s3://bucket/gateways/{gateway_id}/tools/
     # - Easy listing of all versions of a tool: s3://bucket/gateways/{gateway_id}/tools/{tool_name}/
     # - Simple cleanup policies per gateways or tool
-    object_key = f"gateways/{gateway_id}/tools/{tool_name}/{int(time.time())}-{uuid.uuid4().hex}.json"
-    body = json.dumps(spec_json).encode("utf-8")
+    object_key = f"gateways/{gateway_id}/tools/{tool_name}/{int(time.time())}-{os.urandom(8).hex()}.json"
 
-    print(f"Uploading OpenAPI spec to S3: {object_key}")
+    logger.info("Uploading OpenAPI spec to S3: %s", object_key)
     s3.put_object(Bucket=bucket_name, Key=object_key, Body=body, ContentType="application/json")
-    print("✓ OpenAPI spec uploaded.")
+    logger.info("OpenAPI spec uploaded.")
+
+    s3_uri = f"s3://{bucket_name}/{object_key}"
+    logger.info("S3 URI: %s", s3_uri)
+    if len(_spec_uri_cache) >= _SPEC_URI_CACHE_MAX:
+        _spec_uri_cache.clear()
+    _spec_uri_cache[cache_key] = s3_uri
+    return s3_uri
+
+
+def upload_openapi_specs_bulk(items: list[dict], gateway_id: str, bucket_name: str = None, s3_client=None) -> list[str]:
+    """
+    Upload several OpenAPI specs to S3 concurrently.
+
+    Specs are small JSON blobs, so bulk upload time is bounded by request
+    latency rather than bandwidth; issuing the puts from a thread pool against
+    the shared pooled client converts serial round-trips into concurrent ones.
+    The bucket is resolved and verified once for the whole batch, and bodies
+    are serialized up front so pool workers only do I/O.
+
+    Args:
+        items: List of dicts with "spec_json" (dict or raw JSON bytes) and "tool_name"
+        gateway_id: ID of the gateways all specs belong to
+        bucket_name: Optional S3 bucket name; if omitted a default per-account bucket is used
+        s3_client: Optional pre-built S3 client; defaults to the shared module client
+
+    Returns:
+        List of s3://bucket/key strings in input order
+    """
+    s3 = s3_client or _get_s3_client()
+
+    bucket_name = _ensure_s3_bucket(bucket_name, s3)
+
+    prepared = []
+    for item in items:
+        spec_json = item["spec_json"]
+        tool_name = item["tool_name"]
+        object_key = f"gateways/{gateway_id}/tools/{tool_name}/{int(time.time())}-{os.urandom(8).hex()}.json"
+        body = spec_json if isinstance(spec_json, bytes) else orjson.dumps(spec_json)
+        prepared.append((object_key, body))
+
+    def _put(key_body):
+        key, body = key_body
+        s3.put_object(Bucket=bucket_name, Key=key, Body=body, ContentType="application/json")
+        return f"s3://{bucket_name}/{key}"
+
+    logger.info("Uploading %d OpenAPI spec(s) to S3...", len(prepared))
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(prepared)))) as executor:
+        uris = list(executor.map(_put, prepared))
+    logger.info("OpenAPI specs uploaded.")
+    return uris
+
+
+def upload_openapi_spec_fileobj(fileobj, tool_name: str, gateway_id: str, bucket_name: str = None, s3_client=None) -> str:
+    """
+    Upload an OpenAPI spec from a readable binary file object to S3.
+
+    Streams the buffer to S3 via upload_fileobj, so large specs go up as
+    multipart chunks instead of one put_object body held fully in memory.
+
+    Args:
+        fileobj: Readable binary file-like object positioned at the spec start
+        tool_name: Logical name of the tool
+        gateway_id: ID of the gateways this tool is being registered with
+        bucket_name: Optional S3 bucket name; if omitted a default per-account bucket is used
+        s3_client: Optional pre-built S3 client; defaults to the shared module client
+
+    Returns:
+        s3://bucket/key string
+    """
+    s3 = s3_client or _get_s3_client()
+
+    bucket_name = _ensure_s3_bucket(bucket_name, s3)
+
+    object_key = f"gateways/{gateway_id}/tools/{tool_name}/{int(time.time())}-{os.urandom(8).hex()}.json"
+
+    logger.info("Uploading OpenAPI spec to S3: %s", object_key)
+    s3.upload_fileobj(
+        fileobj,
+        bucket_name,
+        object_key,
+        ExtraArgs={"ContentType": "application/json"},
+        Config=_SPEC_TRANSFER_CONFIG
+    )
+    logger.info("OpenAPI spec uploaded.")
 
     s3_uri = f"s3://{bucket_name}/{object_key}"
-    print(f"S3 URI: {s3_uri}")
+    logger.info("S3 URI: %s", s3_uri)
     return s3_uri
 
@@ -4,12 +4,55 @@ Gateway target (tool) creation and deletion.
 Handles OpenAPI schema registration with credential injection.
 """
 import os
-import boto3
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import jmespath
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 AWS_REGION = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
 
-def get_gateway_target(gateway_id: str, target_id: str) -> dict:
+# Compiled once; pulls the spec URI out of a target configuration without
+# the chained .get(..., {}) walk that allocates an empty dict per level.
+# jmespath ships with botocore, so this adds no dependency.
+_S3_URI_EXPR = jmespath.compile("mcp.openApiSchema.s3.uri")
+
+# Connection tuning for the chatty control-plane client: a larger keep-alive
+# pool amortizes TLS handshakes across concurrent calls, adaptive retries
+# back off under throttling, and TCP keepalive stops idle connections from
+# being dropped between bursts.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# Shared session/client, created lazily and reused across calls. boto3 clients
+# are thread-safe, and rebuilding one per call re-reads config, re-resolves
+# endpoints, and opens a fresh HTTPS connection to AWS. boto3 is imported
+# here rather than at module scope so importing this module stays cheap for
+# callers that never touch AWS.
+_session = None
+_gateway_client = None
+
+
+def _get_gateway_client():
+    """Return the shared bedrock-agentcore-control client, creating it on first use."""
+    global _session, _gateway_client
+    if _gateway_client is None:
+        import boto3
+
+        _session = boto3.Session(region_name=AWS_REGION)
+        _gateway_client = _session.client("bedrock-agentcore-control", config=_CLIENT_CONFIG)
+    return _gateway_client
+
+def get_gateway_target(gateway_id: str, target_id: str, client=None) -> dict:
     """
     Retrieve information about a specific gateway target.
 
@@ -18,6 +61,7 @@ def get_gateway_target(gateway_id: str, target_id: str) -> dict:
     Args:
         gateway_id: The unique identifier of the gateway
         target_id: The unique identifier of the target to retrieve
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Target details containing:
@@ -37,17 +81,16 @@ def get_gateway_target(gateway_id: str, target_id: str) -> dict:
         ValueError: If target not found on gateway
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
-    print(f"Retrieving gateway target: {target_id} from gateway: {gateway_id}...")
+    logger.info("Retrieving gateway target: %s from gateway: %s...", target_id, gateway_id)
 
     try:
         response = gateway_client.get_gateway_target(
             gatewayIdentifier=gateway_id,
             targetId=target_id
         )
-        print(f"✓ Gateway target retrieved. Name: {response.get('name')}")
+        logger.info("Gateway target retrieved. Name: %s", response.get("name"))
         return response
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
@@ -57,7 +100,7 @@ def get_gateway_target(gateway_id: str, target_id: str) -> dict:
             raise
 
 
-def list_gateway_targets(gateway_id: str, max_results: int = None, next_token: str = None) -> dict:
+def list_gateway_targets(gateway_id: str, max_results: int = None, next_token: str = None, client=None) -> dict:
     """
     List all targets for a specific gateway.
 
@@ -67,6 +110,7 @@ def list_gateway_targets(gateway_id: str, max_results: int = None, next_token: s
         gateway_id: The unique identifier of the gateway
         max_results: Maximum number of results to return (1-1000). If not provided, uses AWS default.
         next_token: Token for pagination to get the next batch of results
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Contains:
@@ -78,10 +122,9 @@ def list_gateway_targets(gateway_id: str, max_results: int = None, next_token: s
         ValueError: If parameters are invalid
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
-    print(f"Listing all targets for gateway: {gateway_id}...")
+    logger.info("Listing all targets for gateway: %s...", gateway_id)
 
     list_params = {"gatewayIdentifier": gateway_id}
 
@@ -96,14 +139,83 @@ def list_gateway_targets(gateway_id: str, max_results: int = None, next_token: s
     try:
         response = gateway_client.list_gateway_targets(**list_params)
         items = response.get("items", [])
-        print(f"✓ Retrieved {len(items)} target(s).")
+        logger.info("Retrieved %d target(s).", len(items))
         if response.get("nextToken"):
-            print(f"  More results available. Use nextToken to fetch more.")
+            logger.info("More results available. Use nextToken to fetch more.")
         return response
     except ClientError as e:
         raise
 
 
+def wait_for_target_ready(gateway_id: str, target_id: str, timeout: float = 300, client=None) -> dict:
+    """
+    Poll a target until it reaches READY, with capped exponential backoff.
+
+    create_gateway_target returns while the target is still CREATING; callers
+    tend to poll get_gateway_target in a tight loop, hammering the
+    control-plane rate limit. The delay here starts at 500ms, doubles up to a
+    10s cap, and carries jitter so concurrent waiters do not poll in lockstep.
+
+    Args:
+        gateway_id: The unique identifier of the gateway
+        target_id: The unique identifier of the target to wait for
+        timeout: Seconds to wait before giving up
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
+
+    Returns:
+        dict: The target response once its status is READY
+
+    Raises:
+        RuntimeError: If the target reaches FAILED
+        TimeoutError: If the target is not READY within timeout seconds
+        ValueError: If the target does not exist
+        ClientError: If an AWS API call fails
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.5
+    while True:
+        response = get_gateway_target(gateway_id, target_id, client=client)
+        target_status = response.get("status")
+        if target_status == "READY":
+            return response
+        if target_status == "FAILED":
+            raise RuntimeError(f"Target '{target_id}' failed: {response.get('statusReasons')}")
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Target '{target_id}' not READY after {timeout}s (status: {target_status})")
+        time.sleep(delay + random.uniform(0, delay * 0.3))
+        delay = min(delay * 2, 10)
+
+
+def iter_gateway_targets(gateway_id: str, page_size: int = 100, client=None):
+    """
+    Iterate over all targets for a gateway, following pagination lazily.
+
+    Pages are fetched on demand as the generator is consumed, so callers
+    walking a large gateway never hold the full target list in memory and
+    stop paying for HTTP calls as soon as they stop iterating. Use
+    list_gateway_targets for single-page access with an explicit nextToken.
+
+    Args:
+        gateway_id: The unique identifier of the gateway
+        page_size: Number of targets fetched per underlying API call
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
+
+    Yields:
+        dict: Target summary objects (targetId, name, description, status, ...)
+
+    Raises:
+        ClientError: If an AWS API call fails
+    """
+    gateway_client = client or _get_gateway_client()
+
+    paginator = gateway_client.get_paginator("list_gateway_targets")
+    for page in paginator.paginate(
+        gatewayIdentifier=gateway_id,
+        PaginationConfig={"PageSize": page_size}
+    ):
+        yield from page.get("items", [])
+
+
 def create_gateway_target(
     gateway_id: str,
     target_name: str,
@@ -111,7 +223,8 @@ def create_gateway_target(
     api_key_credential_provider_arn: str,
     api_key_param_name: str = "api_key",
     api_key_location: str = "QUERY_PARAMETER",
-    description: str = None
+    description: str = None,
+    client=None
 ) -> dict:
     """
     Create a gateways target (tool) with OpenAPI spec and credential injection.
@@ -128,6 +241,7 @@ def create_gateway_target(
         api_key_param_name: Parameter name for the API key (e.g., "api_key", "Authorization")
         api_key_location: Where to inject the key: "QUERY_PARAMETER" or "HEADER"
         description: Optional target description
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Target creation response containing:
@@ -147,10 +261,16 @@ def create_gateway_target(
         ValueError: If target name already exists on the gateways
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    # Validate before the AWS round-trip: a bad call should fail in
+    # microseconds instead of burning a control-plane request.
+    if api_key_location not in ("QUERY_PARAMETER", "HEADER"):
+        raise ValueError(f"api_key_location must be 'QUERY_PARAMETER' or 'HEADER', got '{api_key_location}'")
+    if not openapi_s3_uri.startswith("s3://"):
+        raise ValueError(f"openapi_s3_uri must be an s3:// URI, got '{openapi_s3_uri}'")
+
+    gateway_client = client or _get_gateway_client()
 
-    print(f"Creating gateways target: {target_name}")
+    logger.info("Creating gateways target: %s", target_name)
 
     # Build target configuration with OpenAPI schema
     target_config = {
@@ -187,34 +307,101 @@ def create_gateway_target(
             targetConfiguration=target_config,
             credentialProviderConfigurations=credential_configs
         )
-        print("✓ Gateway target created.")
-
-        # Log key response details
-        print(f"  Target ID: {create_response.get('targetId')}")
-        print(f"  Gateway ARN: {create_response.get('gatewayArn')}")
-        print(f"  Status: {create_response.get('status')}")
-        print(f"  Name: {create_response.get('name')}")
-        if create_response.get('createdAt'):
-            print(f"  Created At: {create_response.get('createdAt')}")
-        if create_response.get('statusReasons'):
-            print(f"  Status Reasons: {create_response.get('statusReasons')}")
+        logger.info("Gateway target created. Target ID: %s", create_response.get("targetId"))
+        logger.debug("target create response: %s", create_response)
 
         return create_response
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConflictException":
-            print("✗ Target name already exists for this gateways.")
+            logger.info("Target name already exists for this gateways.")
             raise ValueError(f"Target '{target_name}' already exists on gateways {gateway_id}")
         else:
             raise
 
 
+def create_gateway_targets_bulk(gateway_id: str, items: list[dict], client=None) -> list[dict]:
+    """
+    Create several gateway targets concurrently.
+
+    Each create is a blocking control-plane round-trip, so registering N tools
+    serially costs N round-trips of wall-clock. The shared client is
+    thread-safe and its connection pool is sized for concurrency, so fanning
+    the calls out over a small thread pool cuts that to roughly N/workers.
+
+    Args:
+        gateway_id: ID of the gateways all targets belong to
+        items: List of keyword-argument dicts for create_gateway_target
+            (target_name, openapi_s3_uri, api_key_credential_provider_arn, ...)
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
+
+    Returns:
+        List of per-item dicts in input order, each holding either
+        "response" (the create response) or "error" (the raised exception).
+
+    Raises:
+        Nothing directly; per-item failures are reported in the result list
+        so one conflicting target name does not abort the whole batch.
+    """
+    results = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {
+            executor.submit(create_gateway_target, gateway_id, client=client, **item): index
+            for index, item in enumerate(items)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = {"response": future.result()}
+            except Exception as e:
+                results[index] = {"error": e}
+    return results
+
+
+def delete_gateway_targets_bulk(gateway_id: str, target_ids: list[str], client=None) -> list[dict]:
+    """
+    Delete several gateway targets concurrently.
+
+    Teardown of a gateway with many tools is pure I/O, so the deletes fan out
+    over a thread pool against the shared client. A target that is already
+    gone (ResourceNotFoundException, surfaced as ValueError) is treated as
+    successfully deleted rather than failing the batch.
+
+    Args:
+        gateway_id: ID of the gateways all targets belong to
+        target_ids: List of target IDs to delete
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
+
+    Returns:
+        List of per-target dicts in input order, each holding either
+        "response" (the delete response, or None if the target was already
+        gone) or "error" (the raised exception).
+    """
+    results = [None] * len(target_ids)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {
+            executor.submit(delete_gateway_target, gateway_id, target_id, client=client): index
+            for index, target_id in enumerate(target_ids)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = {"response": future.result()}
+            except ValueError:
+                # Already deleted — the desired end state
+                results[index] = {"response": None}
+            except Exception as e:
+                results[index] = {"error": e}
+    return results
+
+
 def update_gateway_target(
     gateway_id: str,
     target_id: str,
     target_name: str,
     target_configuration: dict,
     description: str = None,
-    credential_provider_configurations: list = None
+    credential_provider_configurations: list = None,
+    client=None
 ) -> dict:
     """
     Update an existing gateways target (tool).
@@ -228,6 +415,7 @@ def update_gateway_target(
         target_configuration: The updated target configuration (e.g., mcp with openApiSchema)
         description: Optional updated description
         credential_provider_configurations: Optional updated credential provider configurations
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Update response containing:
@@ -247,23 +435,34 @@ def update_gateway_target(
         ValueError: If target not found on gateways
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
-    print(f"Updating gateways target: {target_id} on gateways: {gateway_id}")
+    logger.info("Updating gateways target: %s on gateways: %s", target_id, gateway_id)
+
+    # The existing target is only needed to backfill pieces the caller did not
+    # provide. When the update carries a full configuration (including the S3
+    # URI) and explicit credentials, skip the describe call so the update is a
+    # single control-plane round-trip.
+    provided_s3_uri = _S3_URI_EXPR.search(target_configuration) if target_configuration else None
+    needs_existing = (
+        target_configuration is None
+        or not provided_s3_uri
+        or credential_provider_configurations is None
+    )
 
     # Fetch existing target to preserve S3 URI and credentials if not provided
     existing_target = None
-    try:
-        existing_target = get_gateway_target(gateway_id, target_id)
-    except Exception as e:
-        print(f"Warning: Could not fetch existing target: {str(e)}")
+    if needs_existing:
+        try:
+            existing_target = get_gateway_target(gateway_id, target_id, client=client)
+        except Exception as e:
+            logger.warning("Could not fetch existing target: %s", e)
 
     # If target_configuration not provided, use existing
     if target_configuration is None:
         if existing_target:
             target_configuration = existing_target.get("targetConfiguration")
-            print(f"No target configuration provided. Using existing configuration.")
+            logger.info("No target configuration provided. Using existing configuration.")
         else:
             raise ValueError(f"target_configuration is required when updating tool if existing target cannot be retrieved")
 
@@ -278,26 +477,12 @@ def update_gateway_target(
     # If target_configuration has an empty S3 URI, preserve existing one
     if existing_target and target_configuration:
         # Check if S3 URI is provided in the new configuration
-        existing_s3_uri = None
-        if existing_target.get("targetConfiguration"):
-            existing_s3_uri = (
-                existing_target.get("targetConfiguration", {})
-                .get("mcp", {})
-                .get("openApiSchema", {})
-                .get("s3", {})
-                .get("uri")
-            )
-
-        new_s3_uri = (
-            target_configuration.get("mcp", {})
-            .get("openApiSchema", {})
-            .get("s3", {})
-            .get("uri")
-        )
+        existing_s3_uri = _S3_URI_EXPR.search(existing_target.get("targetConfiguration") or {})
+        new_s3_uri = _S3_URI_EXPR.search(target_configuration)
 
         # If no S3 URI provided in new config but one exists, use the existing URI
         if not new_s3_uri and existing_s3_uri:
-            print(f"No S3 URI provided in update. Using existing S3 URI: {existing_s3_uri}")
+            logger.info("No S3 URI provided in update. Using existing S3 URI: %s", existing_s3_uri)
             target_configuration["mcp"]["openApiSchema"]["s3"]["uri"] = existing_s3_uri
             update_params["targetConfiguration"] = target_configuration
 
@@ -310,27 +495,18 @@ def update_gateway_target(
         existing_creds = existing_target.get("credentialProviderConfigurations")
         if existing_creds:
             update_params["credentialProviderConfigurations"] = existing_creds
-            print(f"Using existing credential configurations from current target")
+            logger.info("Using existing credential configurations from current target")
 
     # Add optional parameters if provided
     if description is not None:
         update_params["description"] = description
 
-    print(f"Update params: {update_params}")
+    logger.debug("update params: %s", update_params)
 
     try:
         response = gateway_client.update_gateway_target(**update_params)
-        print("✓ Gateway target updated.")
-
-        # Log key response details
-        print(f"  Target ID: {response.get('targetId')}")
-        print(f"  Gateway ARN: {response.get('gatewayArn')}")
-        print(f"  Status: {response.get('status')}")
-        print(f"  Name: {response.get('name')}")
-        if response.get('updatedAt'):
-            print(f"  Updated At: {response.get('updatedAt')}")
-        if response.get('statusReasons'):
-            print(f"  Status Reasons: {response.get('statusReasons')}")
+        logger.info("Gateway target updated. Target ID: %s", response.get("targetId"))
+        logger.debug("target update response: %s", response)
 
         return response
     except ClientError as e:
@@ -341,7 +517,7 @@ def update_gateway_target(
             raise
 
 
-def delete_gateway_target(gateway_id: str, target_id: str) -> dict:
+def delete_gateway_target(gateway_id: str, target_id: str, client=None) -> dict:
     """
     Delete a gateways target (tool) from a gateways.
 
@@ -350,6 +526,7 @@ def delete_gateway_target(gateway_id: str, target_id: str) -> dict:
     Args:
         gateway_id: The unique identifier of the gateways
         target_id: The unique identifier of the target to delete
+        client: Optional pre-built bedrock-agentcore-control client; defaults to the shared module client
 
     Returns:
         dict: Deletion response containing:
@@ -362,17 +539,16 @@ def delete_gateway_target(gateway_id: str, target_id: str) -> dict:
         ValueError: If target not found on gateways
         ClientError: If AWS API call fails
     """
-    session = boto3.Session(region_name=AWS_REGION)
-    gateway_client = session.client("bedrock-agentcore-control")
+    gateway_client = client or _get_gateway_client()
 
-    print(f"Deleting gateways target: {target_id} from gateways: {gateway_id}")
+    logger.info("Deleting gateways target: %s from gateways: %s", target_id, gateway_id)
 
     try:
         response = gateway_client.delete_gateway_target(
             gatewayIdentifier=gateway_id,
             targetId=target_id
         )
-        print(f"✓ Gateway target deletion initiated. Status: {response.get('status')}")
+        logger.info("Gateway target deletion initiated. Status: %s", response.get("status"))
         return response
     except ClientError as e:
         error_code = e.response["Error"]["Code"]